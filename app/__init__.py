@@ -3,20 +3,29 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
 from config import config
+from app.utils.answers import AnswerIndexCache
+from app.utils.cache import PuzzleCache
+from app.utils.json_provider import FastJSONProvider
+from app.utils.routing import RoutingSession
 import re
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
+puzzle_cache = PuzzleCache()
+answer_cache = AnswerIndexCache()
 
 
 def create_app(config_name='default'):
     """Application factory pattern."""
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.json = FastJSONProvider(app)
     
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
+    puzzle_cache.init_app(app)
+    answer_cache.init_app(app)
     
     # Handle CORS with wildcard support
     allowed_origins = app.config.get('ALLOWED_ORIGINS', [])
@@ -36,4 +45,21 @@ def create_app(config_name='default'):
     app.register_blueprint(puzzles_bp, url_prefix='/api/v1')
     app.register_blueprint(health_bp, url_prefix='/api/v1')
     
+    # Register CLI commands
+    from app.cli import puzzles_cli
+    app.cli.add_command(puzzles_cli)
+    
+    # Expose Prometheus metrics at /metrics
+    if app.config.get('METRICS_ENABLED'):
+        from app.utils.metrics import init_metrics
+        init_metrics(app)
+    
+    # On-demand request profiling and the slow-query log
+    if app.config.get('PROFILING_ENABLED'):
+        from app.utils.profiling import init_profiling
+        init_profiling(app)
+    if app.config.get('SLOW_QUERY_THRESHOLD_MS'):
+        from app.utils.profiling import init_slow_query_log
+        init_slow_query_log(app)
+    
     return app
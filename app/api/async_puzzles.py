@@ -0,0 +1,131 @@
+import asyncio
+from flask import request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app import puzzle_cache
+from app.utils.responses import (
+    cache_row, cached_puzzle_response, daily_lookup, date_lookup, payload_query,
+    requested_format, revision_not_modified, revision_query
+)
+from config import engine_options
+
+# Async drivers to use in place of the sync ones, by backend
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+# Endpoints with an async read path -> (lookup, query args that select the batch form)
+ASYNC_LOOKUPS = {
+    'puzzles.get_daily_puzzle': (daily_lookup, ('topics',)),
+    'puzzles.get_puzzle_by_date': (date_lookup, ('start', 'end')),
+}
+
+
+def async_database_url(url):
+    """Swap a database URL's driver for its asyncio counterpart."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f'No async driver is configured for {backend}')
+
+    url = url.set(drivername=ASYNC_DRIVERS[backend])
+
+    # asyncpg takes ssl=... where libpq takes sslmode=...
+    if backend == 'postgresql' and 'sslmode' in url.query:
+        sslmode = url.query['sslmode']
+        url = url.difference_update_query(['sslmode']).update_query_dict({'ssl': sslmode})
+
+    return url
+
+
+def async_lookup():
+    """Return the lookup for a request the async path can serve, or None."""
+    if request.method != 'GET':
+        return None
+
+    lookup, batch_args = ASYNC_LOOKUPS.get(request.endpoint, (None, ()))
+    if lookup is None or any(arg in request.args for arg in batch_args):
+        return None
+
+    return lookup
+
+
+class AsyncPuzzleReader:
+    """Serves single public puzzle reads through an async engine and session.
+
+    It reads the replica when one is configured, like the sync public
+    routes. The engine is created on first use, so it belongs to the
+    worker's event loop rather than to a process it was forked from, and
+    is handed to engine_listeners (the metrics and slow-query hooks) as the
+    'async' bind. While a topic was recently written, misses are left to
+    the Flask view, which reads them from the primary.
+    """
+
+    def __init__(self, config, engine_listeners=()):
+        url = config.get('ASYNC_DATABASE_URL') or config.get('REPLICA_DATABASE_URL') or config['SQLALCHEMY_DATABASE_URI']
+        self.url = async_database_url(url)
+        self.reads_primary = url == config['SQLALCHEMY_DATABASE_URI']
+        self.options = engine_options(url, asyncpg=True)
+        self.engine_listeners = engine_listeners
+        self.engine = None
+        self._sessionmaker = None
+
+    def session(self):
+        if self._sessionmaker is None:
+            self.engine = create_async_engine(self.url, **self.options)
+            for listener in self.engine_listeners:
+                listener('async', self.engine.sync_engine)
+            self._sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+        return self._sessionmaker()
+
+    async def dispose(self):
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = self._sessionmaker = None
+
+    @staticmethod
+    async def _cache_call(function, *args):
+        """Run a puzzle cache call, in a thread when it may block on the shared store."""
+        if puzzle_cache.shared is None:
+            return function(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def response(self, lookup):
+        """Build the response for the current request with the Flask views' helpers.
+
+        Returns None whenever the Flask view should answer instead: invalid
+        parameters, a missing puzzle (both give error responses) and rows
+        whose payload has not been backfilled yet.
+        """
+        try:
+            response_format = requested_format()
+            cache_key, query = lookup()
+        except ValueError:
+            return None
+
+        cached = await self._cache_call(puzzle_cache.get, cache_key)
+
+        if cached is None:
+            if not self.reads_primary and await self._cache_call(puzzle_cache.recently_written, cache_key[1]):
+                return None
+
+            async with self.session() as session:
+                if request.if_none_match:
+                    # Resolve only the revision first so a 304 never loads the JSONB columns
+                    revision = (await session.execute(revision_query(query).statement)).first()
+                    if revision is None:
+                        return None
+
+                    response = revision_not_modified(revision, response_format)
+                    if response is not None:
+                        return response
+
+                row = (await session.execute(payload_query(query).statement)).first()
+
+            if row is None or row.payload is None:
+                return None
+
+            cached = await self._cache_call(cache_row, cache_key, row)
+
+        return cached_puzzle_response(cached, response_format)
@@ -1,19 +1,50 @@
-from flask import jsonify
+from flask import current_app, jsonify
 from app.api import health_bp
 from app import db
+from app.utils.health import DatabaseProbe, pool_stats
+
+
+def _database_probe():
+    probe = current_app.extensions.get('db_probe')
+    if probe is None:
+        probe = DatabaseProbe(current_app.config['HEALTH_PROBE_INTERVAL'])
+        current_app.extensions['db_probe'] = probe
+    return probe
+
+
+def _readiness():
+    """Return the cached readiness report and whether every database is healthy."""
+    results, age = _database_probe().result()
+    healthy = all(result['status'] == 'healthy' for result in results.values())
+    
+    # Pool usage is cheap to read, so it is always current
+    databases = {
+        bind or 'primary': dict(results[bind or 'primary'], pool=pool_stats(engine))
+        for bind, engine in db.engines.items()
+    }
+    
+    return {
+        'status': 'healthy' if healthy else 'degraded',
+        'database': databases['primary']['status'],
+        'databases': databases,
+        'probeAgeSeconds': round(age, 2)
+    }, healthy
 
 
 @health_bp.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint."""
-    try:
-        # Test database connectivity
-        db.session.execute(db.text('SELECT 1'))
-        db_status = 'healthy'
-    except Exception as e:
-        db_status = f'unhealthy: {str(e)}'
-    
-    return jsonify({
-        'status': 'healthy' if db_status == 'healthy' else 'degraded',
-        'database': db_status
-    }), 200 if db_status == 'healthy' else 503
+    """Health check endpoint (same report as /health/ready)."""
+    return readiness_check()
+
+
+@health_bp.route('/health/live', methods=['GET'])
+def liveness_check():
+    """Liveness endpoint; answers without touching the database."""
+    return jsonify({'status': 'alive'}), 200
+
+
+@health_bp.route('/health/ready', methods=['GET'])
+def readiness_check():
+    """Readiness endpoint with a cached database probe and pool usage."""
+    report, healthy = _readiness()
+    return jsonify(report), 200 if healthy else 503
@@ -1,80 +1,409 @@
-from datetime import datetime, date
-from flask import request, jsonify
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime, date, timedelta
+from flask import Response, current_app, g, request, jsonify, stream_with_context
 from app.api import puzzles_bp
-from app.models import Puzzle
-from app import db
-from app.utils.decorators import require_api_key
+from app.models import METADATA_FIELDS, PUZZLE_FIELDS, Puzzle
+from app import answer_cache, db, puzzle_cache
+from app.utils.answers import build_answer_index, check_grid, check_word
+from app.utils.decorators import require_api_key, use_replica
+from app.utils.dialect import latest_per_group
+from app.utils.export import export_query, iter_ndjson
+from app.utils.search import search_puzzles, search_stems, tokenize
+from app.utils.compression import compress_response
+from app.utils.http import combined_etag, etag_matches, not_modified
+from app.utils.responses import (
+    cache_row, cached_puzzle_response, daily_lookup, date_lookup, format_response,
+    payload_query, requested_format, revision_not_modified, revision_query,
+    select_representation, vary_on_format
+)
+from app.utils.streaming import RecordError, iter_json_records
 from sqlalchemy.exc import IntegrityError
 
 
+# Compress puzzle responses that were not precompressed from the cache
+puzzles_bp.after_request(compress_response)
+
+
+def _read_primary_after_write(*topics):
+    """Send this request's reads to the primary while a recent write may not have reached the replica.
+    
+    Otherwise a replica read right after an invalidation could put the old
+    row back in the cache for the full TTL.
+    """
+    if g.get('use_replica') and puzzle_cache.recently_written(*topics):
+        g.use_replica = False
+
+
+def _public_puzzle_response(cache_key, query, response_format=None):
+    """Serve a public puzzle from the cache or the query, honouring If-None-Match.
+    
+    Returns None when the query finds no puzzle.
+    """
+    cached = puzzle_cache.get(cache_key)
+    
+    if cached is None:
+        _read_primary_after_write(cache_key[1])
+        
+        if request.if_none_match:
+            # Resolve only the revision first so a 304 never loads the JSONB columns
+            revision = revision_query(query).first()
+            if not revision:
+                return None
+            
+            response = revision_not_modified(revision, response_format)
+            if response is not None:
+                return response
+        
+        row = payload_query(query).first()
+        if not row:
+            return None
+        
+        cached = cache_row(cache_key, row)
+    
+    return cached_puzzle_response(cached, response_format)
+
+
+def _keyed_puzzles_response(keys, found, response_format=None):
+    """Serve several cached puzzles as one JSON object keyed by topic or date.
+    
+    Returns None when none of the keys has a puzzle.
+    """
+    if not found:
+        return None
+    
+    representations = {key: select_representation(found[key], response_format) for key in keys if key in found}
+    
+    etag = combined_etag(representation[0] for representation in representations.values())
+    if etag_matches(etag):
+        return vary_on_format(not_modified(etag))
+    
+    # Splice the stored payloads together instead of decoding and re-encoding them
+    dumps = current_app.json.dumps
+    members = b','.join(
+        dumps(key).encode('utf-8') + b':' + body
+        for key, (_, body) in representations.items()
+    )
+    missing = dumps([key for key in keys if key not in found]).encode('utf-8')
+    body = b'{"puzzles":{' + members + b'},"missing":' + missing + b'}'
+    
+    return format_response(body, etag, response_format)
+
+
+def resolve_daily_puzzles(topics, day, refresh=False, ttl=None):
+    """Resolve each topic's daily puzzle for day, filling the cache.
+    
+    Topics missing from the cache (or all of them, with refresh=True) are
+    loaded with a single query. Returns {topic: CachedPuzzle} for the topics
+    that have a puzzle.
+    """
+    found = {}
+    
+    if not refresh:
+        cached = puzzle_cache.get_many([('daily', topic, day) for topic in topics])
+        found = {key[1]: value for key, value in cached.items()}
+    
+    uncached = [topic for topic in topics if topic not in found]
+    if uncached:
+        _read_primary_after_write(*uncached)
+        
+        # Keep only the newest puzzle on or before the day for each topic
+        query = db.session.query(
+            Puzzle.topic, Puzzle.id, Puzzle.updated_at, Puzzle.payload
+        ).filter(
+            Puzzle.topic.in_(uncached),
+            Puzzle.is_active.is_(True),
+            Puzzle.publish_date <= day
+        )
+        
+        for row in latest_per_group(query, Puzzle.topic, Puzzle.publish_date):
+            found[row.topic] = cache_row(('daily', row.topic, day), row, ttl)
+    
+    return found
+
+
+def _get_puzzles_by_date_range(topic, start_date, end_date, response_format=None):
+    """Get a topic's puzzles for every date in a range, keyed by ISO date."""
+    dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    cached = puzzle_cache.get_many([('date', topic, puzzle_date) for puzzle_date in dates])
+    found = {key[2].isoformat(): value for key, value in cached.items()}
+    
+    uncached = [puzzle_date for puzzle_date in dates if puzzle_date.isoformat() not in found]
+    if uncached:
+        _read_primary_after_write(topic)
+        
+        rows = db.session.query(
+            Puzzle.publish_date, Puzzle.id, Puzzle.updated_at, Puzzle.payload
+        ).filter(
+            Puzzle.topic == topic,
+            Puzzle.is_active.is_(True),
+            Puzzle.publish_date.in_(uncached)
+        ).all()
+        
+        for row in rows:
+            found[row.publish_date.isoformat()] = cache_row(('date', topic, row.publish_date), row)
+    
+    keys = [puzzle_date.isoformat() for puzzle_date in dates]
+    return _keyed_puzzles_response(keys, found, response_format)
+
+
 @puzzles_bp.route('/puzzles/daily', methods=['GET'])
+@use_replica
 def get_daily_puzzle():
-    """Get today's puzzle for a specific topic."""
-    topic = request.args.get('topic', 'shopping')
-    today = date.today()
+    """Get today's puzzle for a specific topic, or for several with ?topics=a,b."""
+    try:
+        response_format = requested_format()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    puzzle = Puzzle.query.filter_by(
-        topic=topic,
-        publish_date=today,
-        is_active=True
-    ).first()
+    if 'topics' in request.args:
+        topics = list(dict.fromkeys(
+            topic.strip() for topic in request.args['topics'].split(',') if topic.strip()
+        ))
+        
+        if not topics:
+            return jsonify({'error': 'Topics parameter must list at least one topic'}), 400
+        
+        max_topics = current_app.config['BATCH_MAX_TOPICS']
+        if len(topics) > max_topics:
+            return jsonify({'error': f'At most {max_topics} topics can be requested at once'}), 400
+        
+        response = _keyed_puzzles_response(
+            topics,
+            resolve_daily_puzzles(topics, date.today()),
+            response_format
+        )
+        
+        if response is None:
+            return jsonify({'error': f'No puzzles found for topics: {", ".join(topics)}'}), 404
+        
+        return response
     
-    if not puzzle:
-        # If no puzzle for today, get the most recent active puzzle for this topic
-        puzzle = Puzzle.query.filter_by(
-            topic=topic,
-            is_active=True
-        ).filter(
-            Puzzle.publish_date <= today
-        ).order_by(
-            Puzzle.publish_date.desc()
-        ).first()
+    topic = request.args.get('topic', 'shopping')
+    response = _public_puzzle_response(*daily_lookup(), response_format)
     
-    if not puzzle:
+    if response is None:
         return jsonify({'error': f'No puzzle found for topic: {topic}'}), 404
     
-    return jsonify(puzzle.to_dict()), 200
+    return response
 
 
 @puzzles_bp.route('/puzzles/date', methods=['GET'])
+@use_replica
 def get_puzzle_by_date():
-    """Get puzzle for a specific date and topic."""
+    """Get puzzle for a specific date and topic, or for a range with ?start=&end=."""
     topic = request.args.get('topic', 'shopping')
+    
+    try:
+        response_format = requested_format()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if 'start' in request.args or 'end' in request.args:
+        start_str = request.args.get('start')
+        end_str = request.args.get('end')
+        
+        if not start_str or not end_str:
+            return jsonify({'error': 'Both start and end parameters are required (format: YYYY-MM-DD)'}), 400
+        
+        try:
+            start_date = datetime.strptime(start_str, '%Y-%m-%d').date()
+            end_date = datetime.strptime(end_str, '%Y-%m-%d').date()
+        except ValueError:
+            return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+        
+        if end_date < start_date:
+            return jsonify({'error': 'End date must not be before start date'}), 400
+        
+        max_days = current_app.config['BATCH_MAX_DAYS']
+        if (end_date - start_date).days + 1 > max_days:
+            return jsonify({'error': f'Date ranges are limited to {max_days} days'}), 400
+        
+        response = _get_puzzles_by_date_range(topic, start_date, end_date, response_format)
+        
+        if response is None:
+            return jsonify({'error': f'No puzzles found for topic: {topic} between {start_str} and {end_str}'}), 404
+        
+        return response
+    
     date_str = request.args.get('date')
     
     if not date_str:
         return jsonify({'error': 'Date parameter is required (format: YYYY-MM-DD)'}), 400
     
     try:
-        puzzle_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        lookup = date_lookup()
     except ValueError:
         return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
     
-    puzzle = Puzzle.query.filter_by(
-        topic=topic,
-        publish_date=puzzle_date,
-        is_active=True
-    ).first()
+    response = _public_puzzle_response(*lookup, response_format)
     
-    if not puzzle:
+    if response is None:
         return jsonify({'error': f'No puzzle found for topic: {topic} on date: {date_str}'}), 404
     
-    return jsonify(puzzle.to_dict()), 200
+    return response
+
+
+def _answer_index(puzzle_id):
+    """Return the answer index of a published puzzle, or None if there is none."""
+    revision = db.session.query(Puzzle.id, Puzzle.updated_at).filter(
+        Puzzle.id == puzzle_id,
+        Puzzle.is_active.is_(True),
+        Puzzle.publish_date <= date.today()
+    ).first()
+    
+    if not revision:
+        return None
+    
+    def load():
+        return db.session.query(Puzzle.grid_data, Puzzle.clue_positions).filter(Puzzle.id == puzzle_id).one()
+    
+    return answer_cache.get((revision.id, revision.updated_at), load)
+
+
+@puzzles_bp.route('/puzzles/<uuid:puzzle_id>/check', methods=['POST'])
+@use_replica
+def check_answers(puzzle_id):
+    """Check a guess for one clue, or a whole grid, against a published puzzle.
+    
+    ``{"clue": "1", "guess": "SHOPIFY"}`` returns whether the word is right
+    and which of its cells are; ``{"grid": [[...], ...]}`` returns whether
+    each clue's word is right.
+    """
+    data = request.get_json(silent=True)
+    
+    if not isinstance(data, dict) or ('clue' not in data and 'grid' not in data):
+        return jsonify({'error': 'Provide a clue and guess, or a grid'}), 400
+    
+    index = _answer_index(puzzle_id)
+    
+    if index is None:
+        return jsonify({'error': 'Puzzle not found'}), 404
+    if not index:
+        return jsonify({'error': 'Puzzle has no clues that can be checked'}), 422
+    
+    if 'grid' in data:
+        if not isinstance(data['grid'], list):
+            return jsonify({'error': 'Grid must be a list of rows'}), 400
+        
+        clues = check_grid(index, data['grid'])
+        return jsonify({'correct': all(clues.values()), 'clues': clues}), 200
+    
+    clue = str(data['clue'])
+    guess = data.get('guess')
+    
+    if not isinstance(guess, (str, list)):
+        return jsonify({'error': 'Guess must be a string or a list of cells'}), 400
+    
+    if clue not in index:
+        return jsonify({'error': f'Unknown clue: {clue}'}), 400
+    
+    cells = check_word(index[clue], guess)
+    return jsonify({'clue': clue, 'correct': all(cells), 'cells': cells}), 200
+
+
+def _requested_fields(default):
+    """Parse the ``fields`` query parameter into a list of API field names.
+    
+    ``fields=all`` selects every field. Raises ValueError for unknown names.
+    """
+    value = request.args.get('fields')
+    
+    if not value:
+        return list(default)
+    if value == 'all':
+        return list(PUZZLE_FIELDS)
+    
+    fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    unknown_fields = [field for field in fields if field not in PUZZLE_FIELDS]
+    if unknown_fields:
+        raise ValueError(
+            f'Unknown fields: {", ".join(unknown_fields)}. '
+            f'Valid fields: {", ".join(PUZZLE_FIELDS)}'
+        )
+    
+    return fields
+
+
+def _encode_cursor(puzzle):
+    """Encode the keyset position after a puzzle as an opaque cursor."""
+    position = json.dumps([puzzle.publish_date.isoformat(), str(puzzle.id)])
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """Decode a cursor into (publish_date, id). Raises ValueError if malformed."""
+    try:
+        publish_date, puzzle_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.strptime(publish_date, '%Y-%m-%d').date(), uuid.UUID(puzzle_id)
+    except (TypeError, ValueError, UnicodeError, binascii.Error):
+        raise ValueError('Invalid cursor')
+
+
+def _list_puzzles_by_cursor(query, after, per_page, fields):
+    """Keyset-paginate puzzles on (publish_date, id), newest first.
+    
+    Each page is a range scan from the previous page's last row, so its
+    cost does not grow with depth the way OFFSET does.
+    """
+    if after:
+        query = query.filter(db.tuple_(Puzzle.publish_date, Puzzle.id) < db.tuple_(*after))
+    
+    # Fetch one extra row to learn whether another page follows
+    puzzles = query.order_by(
+        Puzzle.publish_date.desc(), Puzzle.id.desc()
+    ).limit(per_page + 1).all()
+    
+    next_cursor = _encode_cursor(puzzles[per_page - 1]) if len(puzzles) > per_page else None
+    
+    return {
+        'puzzles': [puzzle.to_dict(fields) for puzzle in puzzles[:per_page]],
+        'per_page': per_page,
+        'next_cursor': next_cursor
+    }
 
 
 @puzzles_bp.route('/puzzles', methods=['GET'])
 @require_api_key
 def list_puzzles():
-    """List all puzzles with optional filters (admin only)."""
+    """List all puzzles with optional filters (admin only).
+    
+    Passing ``cursor`` (empty for the first page) switches from page numbers
+    to keyset pagination; ``include_total=true`` adds the total count.
+    Only metadata fields are returned unless ``fields`` asks for more.
+    """
     topic = request.args.get('topic')
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    query = Puzzle.query
+    try:
+        fields = _requested_fields(METADATA_FIELDS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Unrequested columns stay deferred; publish_date is needed for cursors
+    query = Puzzle.query.options(Puzzle.load_fields(fields + ['publishDate']))
     
     if topic:
         query = query.filter_by(topic=topic)
     
+    if 'cursor' in request.args:
+        cursor = request.args['cursor']
+        
+        try:
+            after = _decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        result = _list_puzzles_by_cursor(query, after, max(per_page, 1), fields)
+        
+        if request.args.get('include_total', '').lower() in ('1', 'true', 'yes'):
+            result['total'] = query.order_by(None).count()
+        
+        return jsonify(result), 200
+    
     # Order by publish date descending
     query = query.order_by(Puzzle.publish_date.desc())
     
@@ -82,7 +411,7 @@ def list_puzzles():
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     
     return jsonify({
-        'puzzles': [puzzle.to_dict() for puzzle in pagination.items],
+        'puzzles': [puzzle.to_dict(fields) for puzzle in pagination.items],
         'total': pagination.total,
         'page': page,
         'per_page': per_page,
@@ -90,6 +419,195 @@ def list_puzzles():
     }), 200
 
 
+REQUIRED_FIELDS = ['title', 'topic', 'grid_size', 'grid_data', 'across_clues',
+                   'down_clues', 'clue_positions', 'publish_date']
+
+# Accepted JSON types per field, with the name used in validation errors
+FIELD_TYPES = {
+    'title': (str, 'a string'),
+    'topic': (str, 'a string'),
+    'difficulty': (str, 'a string'),
+    'grid_size': (int, 'an integer'),
+    'grid_data': (list, 'an array of rows'),
+    'across_clues': (dict, 'an object'),
+    'down_clues': (dict, 'an object'),
+    'clue_positions': (dict, 'an object'),
+    'is_active': (bool, 'a boolean'),
+}
+
+CLUE_DIRECTIONS = ('across', 'down')
+
+
+def _is_int(value):
+    # bool is an int subclass, so true/false would pass as a number
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_shapes(data):
+    """Check the grid, clues and clue positions have the shapes the API serves.
+    
+    Raises ValueError naming the first offending field.
+    """
+    for row_number, row in enumerate(data['grid_data']):
+        if not isinstance(row, list) or not all(cell is None or isinstance(cell, str) for cell in row):
+            raise ValueError(f'grid_data[{row_number}] must be an array of strings or nulls')
+    
+    for field in ('across_clues', 'down_clues'):
+        for number, clue in data[field].items():
+            if not isinstance(clue, str):
+                raise ValueError(f'{field}.{number} must be a string')
+    
+    for number, position in data['clue_positions'].items():
+        if not isinstance(position, dict):
+            raise ValueError(f'clue_positions.{number} must be an object')
+        for key in ('row', 'col', 'length'):
+            if not _is_int(position.get(key)):
+                raise ValueError(f'clue_positions.{number}.{key} must be an integer')
+        if position.get('direction') not in CLUE_DIRECTIONS:
+            raise ValueError(f'clue_positions.{number}.direction must be across or down')
+
+
+def _puzzle_values(data):
+    """Validate a create payload and return the Puzzle column values.
+    
+    Raises ValueError with a message suitable for the API response.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Puzzle must be a JSON object')
+    
+    missing_fields = [field for field in REQUIRED_FIELDS if field not in data]
+    if missing_fields:
+        raise ValueError(f'Missing required fields: {", ".join(missing_fields)}')
+    
+    for field, (types, description) in FIELD_TYPES.items():
+        if field not in data:
+            continue
+        value = data[field]
+        if not (_is_int(value) if types is int else isinstance(value, types)):
+            raise ValueError(f'{field} must be {description}')
+    
+    _check_shapes(data)
+    
+    try:
+        publish_date = datetime.strptime(data['publish_date'], '%Y-%m-%d').date()
+    except (TypeError, ValueError) as e:
+        raise ValueError(f'Invalid date format: {str(e)}')
+    
+    return {
+        'title': data['title'],
+        'topic': data['topic'],
+        'difficulty': data.get('difficulty', 'medium'),
+        'grid_size': data['grid_size'],
+        'grid_data': data['grid_data'],
+        'across_clues': data['across_clues'],
+        'down_clues': data['down_clues'],
+        'clue_positions': data['clue_positions'],
+        'publish_date': publish_date,
+        'is_active': data.get('is_active', True)
+    }
+
+
+@puzzles_bp.route('/puzzles/export', methods=['GET'])
+@require_api_key
+def export_puzzles():
+    """Stream puzzles as NDJSON, optionally filtered (admin only)."""
+    topics = [topic.strip() for topic in request.args.get('topic', '').split(',') if topic.strip()]
+    is_active = request.args.get('is_active')
+    
+    try:
+        start_date = request.args.get('start')
+        end_date = request.args.get('end')
+        start_date = datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None
+        end_date = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None
+    except ValueError:
+        return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+    
+    if is_active is not None:
+        is_active = is_active.lower() in ('1', 'true', 'yes')
+    
+    query = export_query(topics, start_date, end_date, is_active)
+    
+    response = Response(stream_with_context(iter_ndjson(query)), mimetype='application/x-ndjson')
+    response.headers['Content-Disposition'] = 'attachment; filename=puzzles.ndjson'
+    return response
+
+
+# Fields returned for each search result, besides its rank and matches
+SEARCH_RESULT_FIELDS = ('id', 'title', 'topic', 'publishDate', 'isActive')
+
+
+def _search_matches(puzzle, terms, stems):
+    """List the clues of a puzzle whose text or answer contains a query term.
+    
+    stems maps words to the lexemes search matches them by (see search_stems).
+    """
+    matches = []
+    
+    for number, entry in build_answer_index(puzzle.grid_data, puzzle.clue_positions).items():
+        clues = puzzle.across_clues if entry.direction == 'across' else puzzle.down_clues
+        clue = clues.get(number) if isinstance(clues, dict) else None
+        answer = ''.join(entry.cells) if None not in entry.cells else None
+        
+        words = tokenize(f'{clue or ""} {answer or ""}')
+        if any(stems.get(word, frozenset()) & terms for word in words):
+            matches.append({'number': number, 'direction': entry.direction, 'clue': clue, 'answer': answer})
+    
+    return matches
+
+
+@puzzles_bp.route('/puzzles/search', methods=['GET'])
+@require_api_key
+def search_archive():
+    """Search clues and answers across the archive, best matches first (admin only).
+    
+    Uses the full-text index on PostgreSQL and an in-memory inverted index
+    elsewhere. Each result lists the clues that matched.
+    """
+    query = request.args.get('q', '').strip()
+    topic = request.args.get('topic')
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
+    
+    if not query:
+        return jsonify({'error': 'Query parameter q is required'}), 400
+    
+    # Fetch one extra hit to learn whether another page follows
+    hits = search_puzzles(query, topic, per_page + 1, (page - 1) * per_page)
+    has_more = len(hits) > per_page
+    hits = hits[:per_page]
+    
+    fields = list(SEARCH_RESULT_FIELDS) + ['acrossClues', 'downClues', 'answers', 'cluePositions']
+    puzzles = {
+        puzzle.id: puzzle
+        for puzzle in Puzzle.query.options(Puzzle.load_fields(fields)).filter(
+            Puzzle.id.in_([puzzle_id for puzzle_id, _ in hits])
+        )
+    } if hits else {}
+    
+    # Stem the query and result words together, so matches agree with the ranking
+    tokens = tokenize(query)
+    stems = search_stems(tokens + [
+        word for puzzle in puzzles.values() for word in tokenize(puzzle.build_search_text())
+    ])
+    terms = frozenset().union(*(stems[token] for token in tokens))
+    results = [
+        dict(
+            puzzles[puzzle_id].to_dict(SEARCH_RESULT_FIELDS),
+            rank=round(float(score), 4),
+            matches=_search_matches(puzzles[puzzle_id], terms, stems)
+        )
+        for puzzle_id, score in hits if puzzle_id in puzzles
+    ]
+    
+    return jsonify({
+        'query': query,
+        'results': results,
+        'page': page,
+        'per_page': per_page,
+        'has_more': has_more
+    }), 200
+
+
 @puzzles_bp.route('/puzzles', methods=['POST'])
 @require_api_key
 def create_puzzle():
@@ -99,39 +617,17 @@ def create_puzzle():
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
-    # Validate required fields
-    required_fields = ['title', 'topic', 'grid_size', 'grid_data', 'across_clues', 
-                       'down_clues', 'clue_positions', 'publish_date']
-    
-    missing_fields = [field for field in required_fields if field not in data]
-    if missing_fields:
-        return jsonify({'error': f'Missing required fields: {", ".join(missing_fields)}'}), 400
-    
     try:
-        # Parse publish_date
-        publish_date = datetime.strptime(data['publish_date'], '%Y-%m-%d').date()
-        
-        # Create new puzzle
-        puzzle = Puzzle(
-            title=data['title'],
-            topic=data['topic'],
-            difficulty=data.get('difficulty', 'medium'),
-            grid_size=data['grid_size'],
-            grid_data=data['grid_data'],
-            across_clues=data['across_clues'],
-            down_clues=data['down_clues'],
-            clue_positions=data['clue_positions'],
-            publish_date=publish_date,
-            is_active=data.get('is_active', True)
-        )
+        puzzle = Puzzle(**_puzzle_values(data))
         
         db.session.add(puzzle)
         db.session.commit()
+        puzzle_cache.invalidate_topic(puzzle.topic)
         
         return jsonify(puzzle.to_dict()), 201
         
     except ValueError as e:
-        return jsonify({'error': f'Invalid date format: {str(e)}'}), 400
+        return jsonify({'error': str(e)}), 400
     except IntegrityError:
         db.session.rollback()
         return jsonify({'error': f'A puzzle already exists for topic "{data["topic"]}" on {data["publish_date"]}'}), 409
@@ -140,16 +636,98 @@ def create_puzzle():
         return jsonify({'error': f'Failed to create puzzle: {str(e)}'}), 500
 
 
+@puzzles_bp.route('/puzzles/bulk', methods=['POST'])
+@require_api_key
+def bulk_create_puzzles():
+    """Create many puzzles from a streamed NDJSON or JSON array body (admin only).
+    
+    Rows are inserted in batches of BULK_INSERT_BATCH_SIZE, one transaction
+    per batch. Rows that already exist for their topic and date are skipped
+    and reported as conflicts, and invalid rows are reported with their
+    error. Only those rows are listed in the results.
+    """
+    batch_size = current_app.config['BULK_INSERT_BATCH_SIZE']
+    counts = {'created': 0, 'conflicts': 0, 'invalid': 0}
+    results = []
+    topics = set()
+    batch = []
+    
+    def flush():
+        inserted_ids = Puzzle.insert_rows([row for _, row in batch])
+        db.session.commit()
+        
+        for record, row in batch:
+            topics.add(row['topic'])
+            if row['id'] in inserted_ids:
+                counts['created'] += 1
+            else:
+                counts['conflicts'] += 1
+                results.append({
+                    'record': record,
+                    'status': 'conflict',
+                    'topic': row['topic'],
+                    'publish_date': row['publish_date'].isoformat()
+                })
+        
+        batch.clear()
+    
+    try:
+        for record, data in enumerate(iter_json_records(request.stream), start=1):
+            try:
+                if isinstance(data, RecordError):
+                    raise data
+                batch.append((record, Puzzle(**_puzzle_values(data)).to_row()))
+            except ValueError as e:
+                counts['invalid'] += 1
+                results.append({'record': record, 'status': 'invalid', 'error': str(e)})
+                continue
+            except Exception:
+                # Anything else is still this row's problem; keep importing the rest
+                current_app.logger.exception('Bulk import record %d could not be prepared', record)
+                counts['invalid'] += 1
+                results.append({'record': record, 'status': 'invalid', 'error': 'Puzzle could not be processed'})
+                continue
+            
+            if len(batch) >= batch_size:
+                flush()
+        
+        if batch:
+            flush()
+        
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception('Bulk puzzle import failed')
+        return jsonify({
+            'error': 'Failed to import puzzles',
+            **counts,
+            'results': results
+        }), 500
+    finally:
+        puzzle_cache.invalidate_topic(*topics)
+    
+    if not any(counts.values()):
+        return jsonify({'error': 'No data provided'}), 400
+    
+    results.sort(key=lambda result: result['record'])
+    
+    return jsonify({**counts, 'results': results}), 200
+
+
 @puzzles_bp.route('/puzzles/<uuid:puzzle_id>', methods=['GET'])
 @require_api_key
 def get_puzzle(puzzle_id):
     """Get a specific puzzle by ID (admin only)."""
-    puzzle = Puzzle.query.get(puzzle_id)
+    try:
+        fields = _requested_fields(PUZZLE_FIELDS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    puzzle = Puzzle.query.options(Puzzle.load_fields(fields)).get(puzzle_id)
     
     if not puzzle:
         return jsonify({'error': 'Puzzle not found'}), 404
     
-    return jsonify(puzzle.to_dict()), 200
+    return jsonify(puzzle.to_dict(fields)), 200
 
 
 @puzzles_bp.route('/puzzles/<uuid:puzzle_id>', methods=['PUT'])
@@ -166,6 +744,9 @@ def update_puzzle(puzzle_id):
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
+    # Remember the original topic so its cached entries are dropped too
+    original_topic = puzzle.topic
+    
     try:
         # Update fields if provided
         if 'title' in data:
@@ -189,9 +770,9 @@ def update_puzzle(puzzle_id):
         if 'is_active' in data:
             puzzle.is_active = data['is_active']
         
-        puzzle.updated_at = datetime.utcnow()
-        
+        # updated_at and the payload are refreshed at flush, only if a field changed
         db.session.commit()
+        puzzle_cache.invalidate_topic(original_topic, puzzle.topic)
         
         return jsonify(puzzle.to_dict()), 200
         
@@ -205,6 +786,50 @@ def update_puzzle(puzzle_id):
         return jsonify({'error': f'Failed to update puzzle: {str(e)}'}), 500
 
 
+@puzzles_bp.route('/puzzles/<topic>/<publish_date>', methods=['PUT'])
+@require_api_key
+def upsert_puzzle(topic, publish_date):
+    """Create or replace the puzzle for a topic and date (admin only).
+    
+    The body is a full puzzle like POST /puzzles; its topic and publish_date
+    come from the URL. Written with an INSERT ... ON CONFLICT DO UPDATE
+    RETURNING, so an existing puzzle keeps its id; a replaced puzzle's
+    payload is then rebuilt with one UPDATE, and an unchanged one is read
+    back. Responds 201 when a puzzle was created.
+    """
+    data = request.get_json()
+    
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Puzzle must be a JSON object'}), 400
+    
+    try:
+        puzzle = Puzzle(**_puzzle_values(dict(data, topic=topic, publish_date=publish_date)))
+        row = puzzle.to_row()
+        
+        inserted_ids, updated = Puzzle.upsert_rows([row])
+        db.session.commit()
+        puzzle_cache.invalidate_topic(topic)
+        
+        if inserted_ids:
+            return jsonify(puzzle.to_dict()), 201
+        
+        # An unchanged puzzle isn't rewritten, so nothing came back from the upsert
+        stored = updated[0] if updated else Puzzle.query.filter_by(
+            topic=topic, publish_date=row['publish_date']
+        ).one()
+        
+        return jsonify(stored.to_dict()), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception('Saving puzzle for %s on %s failed', topic, publish_date)
+        return jsonify({'error': 'Failed to save puzzle'}), 500
+
+
 @puzzles_bp.route('/puzzles/<uuid:puzzle_id>', methods=['DELETE'])
 @require_api_key
 def delete_puzzle(puzzle_id):
@@ -217,6 +842,7 @@ def delete_puzzle(puzzle_id):
     try:
         db.session.delete(puzzle)
         db.session.commit()
+        puzzle_cache.invalidate_topic(puzzle.topic)
         
         return jsonify({'message': 'Puzzle deleted successfully'}), 200
         
@@ -0,0 +1,116 @@
+from asgiref.wsgi import WsgiToAsgi
+from flask import request
+from app import create_app
+from app.api.async_puzzles import AsyncPuzzleReader, async_lookup
+from app.utils.profiling import PROFILE_HEADER
+from app.utils.warmup import start_cache_scheduler
+
+
+def _environ(scope):
+    """Build a minimal WSGI environ for a bodiless ASGI HTTP request."""
+    server_name, server_port = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f'HTTP/{scope.get("http_version", "1.1")}',
+        'REMOTE_ADDR': client[0],
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': None,
+        'wsgi.errors': None,
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+
+    for name, value in scope['headers']:
+        name = name.decode('latin-1').upper().replace('-', '_')
+        if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            name = f'HTTP_{name}'
+        value = value.decode('latin-1')
+        environ[name] = f'{environ[name]},{value}' if name in environ else value
+
+    return environ
+
+
+async def _send_response(response, send):
+    await send({
+        'type': 'http.response.start',
+        'status': response.status_code,
+        'headers': [
+            (name.lower().encode('latin-1'), value.encode('latin-1'))
+            for name, value in response.headers.items()
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': response.get_data()})
+
+
+class PuzzleASGIApp:
+    """ASGI application with an async read path for the public puzzle routes.
+
+    Single daily and date lookups are served on the event loop through
+    AsyncPuzzleReader, so one process keeps many reads in flight. Every
+    other request, including the admin routes and anything the async path
+    declines, runs through the Flask app in asgiref's thread pool. Flask's
+    before/after request hooks (CORS, compression, metrics) run either way.
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.reader = AsyncPuzzleReader(flask_app.config, flask_app.extensions.get('engine_listeners', ()))
+        self.wsgi = WsgiToAsgi(flask_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            response = await self._async_response(scope)
+            if response is not None:
+                return await _send_response(response, send)
+
+        await self.wsgi(scope, receive, send)
+
+    async def _async_response(self, scope):
+        """Return the async path's response, or None to hand the request to Flask."""
+        app = self.flask_app
+
+        with app.request_context(_environ(scope)):
+            lookup = async_lookup()
+            # Profiled requests need the whole request on one thread
+            if lookup is None or PROFILE_HEADER in request.headers:
+                return None
+
+            try:
+                response = app.preprocess_request()
+                if response is None:
+                    response = await self.reader.response(lookup)
+                    if response is None:
+                        return None
+                return app.process_response(app.make_response(response))
+            except Exception as e:
+                return app.make_response(app.handle_exception(e))
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                start_cache_scheduler(self.flask_app)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                scheduler = self.flask_app.extensions.get('cache_scheduler')
+                if scheduler is not None:
+                    scheduler.stop()
+                await self.reader.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def create_asgi_app(config_name='default'):
+    """Create the Flask app and wrap it for an ASGI server such as uvicorn."""
+    return PuzzleASGIApp(create_app(config_name))
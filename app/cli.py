@@ -0,0 +1,218 @@
+import multiprocessing
+import os
+from datetime import date, timedelta
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from app import db, puzzle_cache
+from app.models import Puzzle
+from app.utils.answers import build_answer_index
+from app.utils.export import export_query, iter_ndjson
+from app.utils.generator import CrosswordGenerator, day_rng, normalize_word, puzzle_fields
+
+puzzles_cli = AppGroup('puzzles', help='Puzzle maintenance commands.')
+
+
+@puzzles_cli.command('backfill-payload')
+@click.option('--batch-size', default=500, show_default=True, help='Puzzles updated per transaction.')
+@click.option('--all', 'refresh_all', is_flag=True, help='Also rebuild payloads that are already set.')
+def backfill_payload(batch_size, refresh_all):
+    """Store the serialized API payload and search document for existing puzzles."""
+    query = Puzzle.query.order_by(Puzzle.id)
+    if not refresh_all:
+        query = query.filter(db.or_(Puzzle.payload.is_(None), Puzzle.search_text.is_(None)))
+    
+    updated = 0
+    last_id = None
+    
+    while True:
+        batch_query = query
+        if last_id is not None:
+            batch_query = batch_query.filter(Puzzle.id > last_id)
+        
+        puzzles = batch_query.limit(batch_size).all()
+        if not puzzles:
+            break
+        
+        for puzzle in puzzles:
+            puzzle.refresh_payload()
+        
+        last_id = puzzles[-1].id
+        db.session.commit()
+        updated += len(puzzles)
+        click.echo(f'Backfilled {updated} puzzle(s)...')
+    
+    click.echo(f'Done. {updated} payload(s) written.')
+
+
+@puzzles_cli.command('export')
+@click.option('--topic', 'topics', multiple=True, help='Only export this topic (repeatable).')
+@click.option('--start', 'start_date', type=click.DateTime(formats=['%Y-%m-%d']), help='First publish date to include.')
+@click.option('--end', 'end_date', type=click.DateTime(formats=['%Y-%m-%d']), help='Last publish date to include.')
+@click.option('--active/--inactive', 'is_active', default=None, help='Only export active or inactive puzzles.')
+@click.option('--output', '-o', type=click.File('wb'), default='-', help='File to write (defaults to stdout).')
+@click.option('--batch-size', default=1000, show_default=True, help='Rows fetched per server-side cursor round trip.')
+def export(topics, start_date, end_date, is_active, output, batch_size):
+    """Stream puzzles to NDJSON, one puzzle per line."""
+    query = export_query(
+        topics,
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+        is_active
+    )
+    
+    exported = 0
+    for line in iter_ndjson(query, batch_size):
+        output.write(line)
+        exported += 1
+    
+    click.echo(f'Exported {exported} puzzle(s).', err=True)
+
+
+def _read_word_list(lines):
+    """Parse word list lines (``word`` or ``word<TAB>clue``) into {word: clue}."""
+    words = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        word, _, clue = line.partition('\t')
+        word = normalize_word(word)
+        if len(word) >= 2:
+            words.setdefault(word, clue.strip() or None)
+    return words
+
+
+def _topic_word_list(topic):
+    """Collect {word: clue} from the answers of a topic's existing puzzles."""
+    words = {}
+    puzzles = db.session.query(
+        Puzzle.grid_data, Puzzle.clue_positions, Puzzle.across_clues, Puzzle.down_clues
+    ).filter(Puzzle.topic == topic)
+    
+    for puzzle in puzzles:
+        for number, entry in build_answer_index(puzzle.grid_data, puzzle.clue_positions).items():
+            if None in entry.cells:
+                continue
+            clues = puzzle.across_clues if entry.direction == 'across' else puzzle.down_clues
+            word = normalize_word(''.join(entry.cells))
+            if len(word) >= 2:
+                words.setdefault(word, clues.get(number))
+    
+    return words
+
+
+# Set in each generator process by _init_generator
+_generator = None
+
+
+def _init_generator(words, options):
+    global _generator
+    _generator = CrosswordGenerator(words, **options)
+
+
+def _generate_day(task):
+    seed, topic, publish_date = task
+    return publish_date, _generator.generate(day_rng(seed, topic, publish_date))
+
+
+@puzzles_cli.command('generate')
+@click.option('--topic', required=True, help='Topic to generate puzzles for.')
+@click.option('--words', 'word_file', type=click.File('r'),
+              help='Word list, one word per line with an optional tab-separated clue. '
+                   'Defaults to the answers of the topic\'s existing puzzles.')
+@click.option('--start', 'start_date', type=click.DateTime(formats=['%Y-%m-%d']), help='First publish date (default tomorrow).')
+@click.option('--days', default=365, show_default=True, help='Consecutive days to generate.')
+@click.option('--size', default=12, show_default=True, help='Grid rows and columns.')
+@click.option('--target-words', default=12, show_default=True, help='Words to place per puzzle.')
+@click.option('--min-words', default=6, show_default=True, help='Skip days whose best grid has fewer words.')
+@click.option('--difficulty', default='medium', show_default=True)
+@click.option('--title', help='Puzzle title (default "<Topic> Crossword").')
+@click.option('--inactive', is_flag=True, help='Insert the puzzles as inactive.')
+@click.option('--workers', type=int, help='Generator processes (default: CPU count).')
+@click.option('--seed', default='', help='Extra seed; a puzzle depends only on seed, topic and date.')
+@click.option('--dry-run', is_flag=True, help='Generate without inserting.')
+def generate(topic, word_file, start_date, days, size, target_words, min_words, difficulty, title,
+             inactive, workers, seed, dry_run):
+    """Generate and insert a topic's puzzles for a range of days.
+    
+    Days that already have a puzzle for the topic are left alone. Grids are
+    built in parallel processes and inserted in BULK_INSERT_BATCH_SIZE
+    batches with the bulk import's conflict handling.
+    """
+    words = _read_word_list(word_file) if word_file else _topic_word_list(topic)
+    if len(words) < min_words:
+        raise click.ClickException(f'Need at least {min_words} words, found {len(words)}.')
+    
+    start_date = start_date.date() if start_date else date.today() + timedelta(days=1)
+    end_date = start_date + timedelta(days=days - 1)
+    
+    existing = {
+        row.publish_date for row in db.session.query(Puzzle.publish_date).filter(
+            Puzzle.topic == topic,
+            Puzzle.publish_date.between(start_date, end_date)
+        )
+    }
+    dates = [start_date + timedelta(days=offset) for offset in range(days)]
+    tasks = [(seed, topic, publish_date) for publish_date in dates if publish_date not in existing]
+    
+    click.echo(f'Generating {len(tasks)} puzzle(s) from {len(words)} words '
+               f'({len(existing)} day(s) already have one)...', err=True)
+    
+    options = {'size': size, 'target_words': target_words, 'min_words': min_words}
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    
+    if workers > 1:
+        with multiprocessing.Pool(workers, _init_generator, (list(words), options)) as pool:
+            results = pool.imap(_generate_day, tasks, chunksize=8)
+            counts = _insert_generated(results, topic, words, size, difficulty, title, inactive, dry_run)
+    else:
+        _init_generator(list(words), options)
+        counts = _insert_generated(map(_generate_day, tasks), topic, words, size, difficulty, title, inactive, dry_run)
+    
+    puzzle_cache.invalidate_topic(topic)
+    click.echo(
+        f'Done. {counts["created"]} created, {counts["conflicts"]} conflict(s), '
+        f'{counts["failed"]} day(s) without a grid of {min_words}+ words.',
+        err=True
+    )
+
+
+def _insert_generated(results, topic, clues, size, difficulty, title, inactive, dry_run):
+    """Insert generated (publish_date, placements) results in batches; return counts."""
+    batch_size = current_app.config['BULK_INSERT_BATCH_SIZE']
+    counts = {'created': 0, 'conflicts': 0, 'failed': 0}
+    rows = []
+    
+    def flush():
+        if not dry_run:
+            inserted_ids = Puzzle.insert_rows(rows)
+            db.session.commit()
+        else:
+            inserted_ids = {row['id'] for row in rows}
+        counts['created'] += len(inserted_ids)
+        counts['conflicts'] += len(rows) - len(inserted_ids)
+        click.echo(f'Inserted {counts["created"]} puzzle(s)...', err=True)
+        rows.clear()
+    
+    for publish_date, placements in results:
+        if placements is None:
+            counts['failed'] += 1
+            continue
+        
+        rows.append(Puzzle(
+            title=title or f'{topic.title()} Crossword',
+            topic=topic,
+            difficulty=difficulty,
+            publish_date=publish_date,
+            is_active=not inactive,
+            **puzzle_fields(placements, size, clues)
+        ).to_row())
+        
+        if len(rows) >= batch_size:
+            flush()
+    
+    if rows:
+        flush()
+    
+    return counts
@@ -1,7 +1,49 @@
 import uuid
 from datetime import datetime
+from flask import current_app
 from app import db
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.utils.answers import build_answer_index
+from app.utils.dialect import TOPIC_DATE_CONFLICT, on_conflict_insert
+from sqlalchemy import event
+from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# JSONB on PostgreSQL, plain JSON on other databases (e.g. SQLite in tests)
+JSONType = db.JSON().with_variant(JSONB(), 'postgresql')
+
+# PostgreSQL text search configuration of the search index; queries must
+# repeat the indexed expression exactly for the index to be used
+SEARCH_CONFIG = 'english'
+SEARCH_VECTOR_SQL = f"to_tsvector('{SEARCH_CONFIG}', search_text)"
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+# API field name -> (backing column, serializer), in response order
+PUZZLE_FIELDS = {
+    'id': ('id', lambda puzzle: str(puzzle.id)),
+    'title': ('title', lambda puzzle: puzzle.title),
+    'topic': ('topic', lambda puzzle: puzzle.topic),
+    'difficulty': ('difficulty', lambda puzzle: puzzle.difficulty),
+    'gridSize': ('grid_size', lambda puzzle: puzzle.grid_size),
+    'acrossClues': ('across_clues', lambda puzzle: puzzle.across_clues),
+    'downClues': ('down_clues', lambda puzzle: puzzle.down_clues),
+    'answers': ('grid_data', lambda puzzle: puzzle.grid_data),
+    'cluePositions': ('clue_positions', lambda puzzle: puzzle.clue_positions),
+    'publishDate': ('publish_date', lambda puzzle: puzzle.publish_date.isoformat()),
+    'isActive': ('is_active', lambda puzzle: puzzle.is_active),
+    'createdAt': ('created_at', lambda puzzle: _isoformat(puzzle.created_at)),
+    'updatedAt': ('updated_at', lambda puzzle: _isoformat(puzzle.updated_at)),
+}
+
+# Fields that need none of the JSONB columns
+METADATA_FIELDS = (
+    'id', 'title', 'topic', 'difficulty', 'gridSize', 'publishDate', 'isActive',
+    'createdAt', 'updatedAt'
+)
 
 
 class Puzzle(db.Model):
@@ -9,43 +51,199 @@ class Puzzle(db.Model):
     
     __tablename__ = 'puzzles'
     
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(db.Uuid, primary_key=True, default=uuid.uuid4)
     title = db.Column(db.String(255), nullable=False)
     topic = db.Column(db.String(100), nullable=False, index=True)
     difficulty = db.Column(db.String(50), default='medium')
     grid_size = db.Column(db.Integer, nullable=False)
-    grid_data = db.Column(JSONB, nullable=False)
-    across_clues = db.Column(JSONB, nullable=False)
-    down_clues = db.Column(JSONB, nullable=False)
-    clue_positions = db.Column(JSONB, nullable=False)
+    grid_data = db.Column(JSONType, nullable=False)
+    across_clues = db.Column(JSONType, nullable=False)
+    down_clues = db.Column(JSONType, nullable=False)
+    clue_positions = db.Column(JSONType, nullable=False)
     publish_date = db.Column(db.Date, nullable=False, index=True)
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # to_dict() serialized to JSON on every write, so reads can send it as-is
+    payload = db.Column(db.Text, nullable=True)
+    # Clues and answer words, kept with the payload for full-text search
+    search_text = db.Column(db.Text, nullable=True)
     
     # Unique constraint: one puzzle per topic per day
     __table_args__ = (
         db.UniqueConstraint('topic', 'publish_date', name='uq_topic_publish_date'),
         db.Index('idx_topic_date', 'topic', 'publish_date'),
+        db.Index('ix_puzzles_search', db.text(SEARCH_VECTOR_SQL), postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
     
     def __repr__(self):
         return f'<Puzzle {self.title} - {self.topic} - {self.publish_date}>'
     
-    def to_dict(self):
-        """Convert puzzle to dictionary for API response."""
-        return {
-            'id': str(self.id),
-            'title': self.title,
-            'topic': self.topic,
-            'difficulty': self.difficulty,
-            'gridSize': self.grid_size,
-            'acrossClues': self.across_clues,
-            'downClues': self.down_clues,
-            'answers': self.grid_data,
-            'cluePositions': self.clue_positions,
-            'publishDate': self.publish_date.isoformat(),
-            'isActive': self.is_active,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self, fields=None):
+        """Convert puzzle to dictionary for API response.
+        
+        Pass a list of API field names to serialize only those; columns
+        behind the other fields are never touched, so they can stay deferred.
+        """
+        if fields is None:
+            fields = PUZZLE_FIELDS
+        
+        return {field: PUZZLE_FIELDS[field][1](self) for field in fields}
+    
+    def build_payload(self):
+        """Serialize the API representation to a JSON string."""
+        return current_app.json.dumps(self.to_dict())
+    
+    def build_search_text(self):
+        """Join the clues and answer words into the document search indexes.
+        
+        Fields with unexpected shapes (possible through PUT or in rows stored
+        before the API validated them) contribute nothing rather than failing.
+        """
+        answers = [
+            ''.join(entry.cells)
+            for entry in build_answer_index(self.grid_data, self.clue_positions).values()
+            if None not in entry.cells
+        ]
+        clues = [
+            text
+            for field in (self.across_clues, self.down_clues) if isinstance(field, dict)
+            for text in field.values() if text is not None
+        ]
+        return '\n'.join(str(text) for text in clues + answers)
+    
+    def refresh_payload(self):
+        """Store the serialized API representation and the search document."""
+        # Column defaults are only applied at INSERT time, but the payload
+        # must already contain the final id and timestamps
+        if self.id is None:
+            self.id = uuid.uuid4()
+        if self.created_at is None:
+            self.created_at = datetime.utcnow()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+        
+        self.payload = self.build_payload()
+        self.search_text = self.build_search_text()
+        # The payload embeds updated_at, so keep onupdate from replacing it at flush
+        flag_modified(self, 'updated_at')
+        return self.payload
+    
+    @classmethod
+    def stored_payload(cls, row):
+        """Return the payload for an (id, payload) row as a JSON string.
+        
+        Rows written before the payload column existed and not yet
+        backfilled are serialized on the fly.
+        """
+        if row.payload is not None:
+            return row.payload
+        
+        puzzle = db.session.get(cls, row.id)
+        payload = puzzle.build_payload()
+        db.session.expunge(puzzle)
+        return payload
+    
+    @classmethod
+    def load_fields(cls, fields):
+        """Return a load_only() option fetching just the columns behind fields."""
+        columns = {PUZZLE_FIELDS[field][0] for field in fields}
+        return db.load_only(*[getattr(cls, column) for column in sorted(columns)])
+    
+    def to_row(self):
+        """Return column values for a Core INSERT, including the payload."""
+        self.refresh_payload()
+        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+    
+    @classmethod
+    def insert_rows(cls, rows):
+        """Insert to_row() dicts in one multi-row INSERT, skipping (topic, date) conflicts.
+        
+        Returns the ids of the rows that were actually inserted.
+        """
+        statement = on_conflict_insert(cls.__table__).values(rows).on_conflict_do_nothing(
+            index_elements=TOPIC_DATE_CONFLICT
+        ).returning(cls.__table__.c.id)
+        
+        return {row.id for row in db.session.execute(statement)}
+    
+    @classmethod
+    def upsert_rows(cls, rows):
+        """Insert to_row() dicts, updating the puzzles that already exist for their (topic, date).
+        
+        Existing rows keep their id and created_at, and are only written when
+        a payload column differs. Their payloads still carry the generated
+        ids, so they are rebuilt from the RETURNING columns and written with
+        one more (executemany) UPDATE. Returns (inserted_ids, updated), where
+        updated holds detached Puzzles with the stored values.
+        """
+        table = cls.__table__
+        statement = on_conflict_insert(table).values(rows)
+        excluded = statement.excluded
+        
+        statement = statement.on_conflict_do_update(
+            index_elements=TOPIC_DATE_CONFLICT,
+            set_={column: excluded[column] for column in PAYLOAD_COLUMNS + ('updated_at',)},
+            where=db.or_(*[table.c[column].is_distinct_from(excluded[column]) for column in PAYLOAD_COLUMNS])
+        ).returning(*table.columns)
+        
+        generated_ids = {row['id'] for row in rows}
+        inserted_ids = set()
+        updated = []
+        
+        for row in db.session.execute(statement):
+            if row.id in generated_ids:
+                inserted_ids.add(row.id)
+            else:
+                updated.append(cls(**row._mapping))
+        
+        if updated:
+            for puzzle in updated:
+                puzzle.payload = puzzle.build_payload()
+                puzzle.search_text = puzzle.build_search_text()
+                
+                # Objects already in the session still hold the old values
+                stale = db.session.identity_map.get(db.inspect(cls).identity_key_from_primary_key([puzzle.id]))
+                if stale is not None:
+                    db.session.expire(stale)
+            
+            # updated_at is passed through so onupdate can't move it away from the payload
+            db.session.execute(table.update().where(table.c.id == db.bindparam('puzzle_id')), [
+                {
+                    'puzzle_id': puzzle.id,
+                    'payload': puzzle.payload,
+                    'search_text': puzzle.search_text,
+                    'updated_at': puzzle.updated_at
+                }
+                for puzzle in updated
+            ])
+        
+        return inserted_ids, updated
+
+
+# Columns whose values end up in the serialized payload
+PAYLOAD_COLUMNS = (
+    'title', 'topic', 'difficulty', 'grid_size', 'grid_data', 'across_clues',
+    'down_clues', 'clue_positions', 'publish_date', 'is_active'
+)
+
+
+@event.listens_for(Puzzle, 'before_insert')
+def _payload_before_insert(mapper, connection, target):
+    target.refresh_payload()
+
+
+@event.listens_for(Puzzle, 'before_update')
+def _payload_before_update(mapper, connection, target):
+    state = db.inspect(target)
+    updated_at_changed = state.attrs.updated_at.history.has_changes()
+    
+    # An explicit updated_at change also ends up in the payload (and the ETag)
+    if not updated_at_changed and not any(state.attrs[column].history.has_changes() for column in PAYLOAD_COLUMNS):
+        return
+    
+    # Set updated_at here rather than through onupdate so the payload matches it
+    if not updated_at_changed:
+        target.updated_at = datetime.utcnow()
+    
+    target.refresh_payload()
@@ -0,0 +1,141 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+# Where a clue's word sits and its normalized answer cells
+AnswerEntry = namedtuple('AnswerEntry', ('row', 'col', 'direction', 'cells'))
+
+# (row, col) step per cell, by clue direction
+STEPS = {'across': (0, 1), 'down': (1, 0)}
+
+
+def _normalize(cell):
+    """Compare cells case-insensitively and ignoring surrounding whitespace."""
+    return cell.strip().upper() if isinstance(cell, str) else None
+
+
+def _as_int(value):
+    """Return value as an int, accepting digit strings; None for anything else."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+def _cell(grid, row, col):
+    if 0 <= row < len(grid) and isinstance(grid[row], list) and 0 <= col < len(grid[row]):
+        return grid[row][col]
+    return None
+
+
+def build_answer_index(grid_data, clue_positions):
+    """Map each clue number to its position and answer cells.
+
+    Walks the answer grid once per clue. Cells that fall on a block or off
+    the grid are None, which no guess matches. Positions that are not
+    objects or lack integer coordinates and length (possible in rows stored
+    before the API validated them) are skipped.
+    """
+    index = {}
+    if not isinstance(clue_positions, dict):
+        return index
+    if not isinstance(grid_data, list):
+        grid_data = []
+
+    for number, position in clue_positions.items():
+        if not isinstance(position, dict):
+            continue
+
+        row, col, length = (_as_int(position.get(key, 0)) for key in ('row', 'col', 'length'))
+        if row is None or col is None or not length:
+            continue
+        # Unknown directions read across, as the clients draw them
+        direction = position.get('direction')
+        direction = direction if isinstance(direction, str) and direction in STEPS else 'across'
+        step_row, step_col = STEPS[direction]
+
+        cells = tuple(
+            _normalize(_cell(grid_data, row + step_row * offset, col + step_col * offset))
+            for offset in range(length)
+        )
+        index[str(number)] = AnswerEntry(row, col, direction, cells)
+
+    return index
+
+
+def check_word(entry, guess):
+    """Return one bool per answer cell for a guess (a string or a list of cells).
+
+    A string guess is split into single letters; puzzles with multi-letter
+    cells need the list form. Missing cells count as wrong.
+    """
+    guess = list(guess)
+    return [
+        answer is not None and offset < len(guess) and _normalize(guess[offset]) == answer
+        for offset, answer in enumerate(entry.cells)
+    ]
+
+
+def check_grid(index, grid):
+    """Return {clue number: correct} for a whole-grid guess."""
+    results = {}
+
+    for number, entry in index.items():
+        step_row, step_col = STEPS.get(entry.direction, STEPS['across'])
+        guess = [
+            _cell(grid, entry.row + step_row * offset, entry.col + step_col * offset)
+            for offset in range(len(entry.cells))
+        ]
+        results[number] = all(check_word(entry, guess))
+
+    return results
+
+
+class AnswerIndexCache:
+    """Bounded in-process LRU of answer indexes keyed by puzzle revision.
+
+    Keys are ``(id, updated_at)`` pairs, so an edited puzzle gets a new
+    entry and the old one simply ages out; nothing needs invalidating.
+    """
+
+    def __init__(self, app=None):
+        self.max_size = 256
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Size the cache like the puzzle cache."""
+        self.max_size = app.config.get('PUZZLE_CACHE_SIZE', 256)
+        self.clear()
+        app.extensions['answer_cache'] = self
+
+    def get(self, revision, load):
+        """Return the index for revision, building it with load() on a miss.
+
+        load is called without arguments and returns (grid_data, clue_positions).
+        """
+        with self._lock:
+            index = self._entries.get(revision)
+            if index is not None:
+                self._entries.move_to_end(revision)
+                return index
+
+        index = build_answer_index(*load())
+
+        if self.max_size > 0:
+            with self._lock:
+                self._entries[revision] = index
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return index
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
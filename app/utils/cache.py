@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import OrderedDict
+from app.utils.http import representation_etag
+from app.utils.shared_cache import SHARED_CACHE_BACKENDS, RedisPuzzleStore
+
+
+class CachedPuzzle:
+    """A serialized puzzle response body and the ETag of its revision.
+
+    Alternative representations derived from the body are built on first
+    use and kept alongside it.
+    """
+
+    __slots__ = ('etag', 'body', 'variants')
+
+    def __init__(self, etag, body):
+        self.etag = etag
+        self.body = body
+        self.variants = {}
+
+    def variant(self, name, build):
+        """Return the (etag, body) of a derived representation, building it once.
+
+        build is called without arguments and returns the variant's body.
+        """
+        variant = self.variants.get(name)
+        if variant is None:
+            variant = (representation_etag(self.etag, name), build())
+            self.variants[name] = variant
+        return variant
+
+
+class PuzzleCache:
+    """Bounded in-process LRU cache with a TTL for public puzzle lookups.
+
+    Keys are ``(kind, topic, date)`` tuples, e.g. ``('daily', 'shopping',
+    date(2026, 1, 17))``, so writes can drop every entry for a topic.
+
+    With a shared store (PUZZLE_CACHE_BACKEND = 'redis'), local misses fall
+    through to it and writes go to both tiers, so the workers on a host load
+    each puzzle from the database once. ``shared`` can be replaced after
+    init_app, e.g. with a store wrapping an in-memory client in tests.
+
+    When reads can come from a replica, invalidate_topic also marks the
+    topic as recently written for REPLICA_WRITE_GRACE seconds (in every
+    worker, through the shared store), and recently_written() tells
+    readers to fill the cache from the primary meanwhile.
+    """
+
+    def __init__(self, app=None):
+        self.max_size = 256
+        self.ttl = 300
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.shared = None
+        self.write_grace = 0
+        self._written = {}
+        # Called as on_lookup(local_hits, shared_hits, misses), e.g. by metrics
+        self.on_lookup = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read cache settings from the app config."""
+        self.max_size = app.config.get('PUZZLE_CACHE_SIZE', 256)
+        self.ttl = app.config.get('PUZZLE_CACHE_TTL', 300)
+        self.clear()
+
+        backend = app.config.get('PUZZLE_CACHE_BACKEND', 'none')
+        if backend not in SHARED_CACHE_BACKENDS:
+            raise ValueError(f'PUZZLE_CACHE_BACKEND must be one of {", ".join(SHARED_CACHE_BACKENDS)}')
+        self.shared = RedisPuzzleStore.from_config(app.config) if backend == 'redis' else None
+
+        reads_elsewhere = app.config.get('REPLICA_DATABASE_URL') or app.config.get('ASYNC_DATABASE_URL')
+        self.write_grace = app.config.get('REPLICA_WRITE_GRACE', 0) if reads_elsewhere else 0
+
+        app.extensions['puzzle_cache'] = self
+
+    @property
+    def enabled(self):
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """Return {key: value} for the keys that are cached in either tier.
+
+        Local misses are looked up in the shared store with one round trip.
+        """
+        if not self.enabled:
+            return {}
+
+        found = {}
+        now = time.monotonic()
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+
+                self._entries.move_to_end(key)
+                found[key] = value
+
+        local_hits = len(found)
+
+        if self.shared is not None:
+            missing = [key for key in keys if key not in found]
+            for key, (etag, body, ttl) in self.shared.get_many(missing).items():
+                value = CachedPuzzle(etag, body)
+                # Keep the local copy no longer than the shared one
+                self._set_local(key, value, min(ttl, self.ttl) if ttl is not None else self.ttl)
+                found[key] = value
+
+        if self.on_lookup is not None:
+            self.on_lookup(local_hits, len(found) - local_hits, len(keys) - len(found))
+
+        return found
+
+    def set(self, key, value, ttl=None):
+        """Store value under key, evicting the least recently used entries."""
+        if not self.enabled:
+            return
+
+        ttl = ttl if ttl is not None else self.ttl
+        self._set_local(key, value, ttl)
+
+        if self.shared is not None:
+            self.shared.set(key, value.etag, value.body, ttl)
+
+    def _set_local(self, key, value, ttl):
+        expires_at = time.monotonic() + ttl
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_topic(self, *topics):
+        """Drop every cached entry for the given topics.
+
+        Other workers' local copies expire within PUZZLE_CACHE_TTL.
+        """
+        topics = set(topics)
+        written_until = time.monotonic() + self.write_grace
+
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[1] in topics]
+            for key in stale_keys:
+                del self._entries[key]
+            if self.write_grace > 0:
+                for topic in topics:
+                    self._written[topic] = written_until
+
+        if self.shared is not None:
+            self.shared.invalidate_topic(*topics)
+            if self.write_grace > 0:
+                self.shared.mark_written(topics, self.write_grace)
+
+    def recently_written(self, *topics):
+        """Return whether any topic was invalidated within the last write_grace seconds."""
+        if self.write_grace <= 0 or not topics:
+            return False
+
+        now = time.monotonic()
+        with self._lock:
+            if any(self._written.get(topic, 0) > now for topic in topics):
+                return True
+
+        return self.shared is not None and self.shared.recently_written(topics)
+
+    def clear(self):
+        """Empty the local tier; shared entries belong to every worker."""
+        with self._lock:
+            self._entries.clear()
+            self._written.clear()
+
+    def __len__(self):
+        return len(self._entries)
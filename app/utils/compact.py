@@ -0,0 +1,59 @@
+COMPACT_MIMETYPE = 'application/vnd.cloverkit.compact+json'
+
+# Stands in for empty (None) cells in packed grid rows
+BLOCK = '#'
+
+DIRECTIONS = {'across': 'a', 'down': 'd'}
+
+
+def _pack_row(row):
+    """Pack a grid row into one string, or keep the list if a cell won't fit."""
+    packable = isinstance(row, list) and all(
+        cell is None or (isinstance(cell, str) and len(cell) == 1 and cell != BLOCK)
+        for cell in row
+    )
+    if not packable:
+        return row
+    return ''.join(BLOCK if cell is None else cell for cell in row)
+
+
+def _pack_direction(direction):
+    return DIRECTIONS.get(direction, direction) if isinstance(direction, str) else direction
+
+
+def _pack_positions(clue_positions):
+    """Pack clue positions into [number, row, col, direction, length] arrays.
+
+    Entries that are not objects (possible in rows stored before the API
+    validated positions) are skipped.
+    """
+    packed = [
+        [
+            int(number) if isinstance(number, str) and number.isdigit() else number,
+            position.get('row'),
+            position.get('col'),
+            _pack_direction(position.get('direction')),
+            position.get('length')
+        ]
+        for number, position in clue_positions.items()
+        if isinstance(position, dict)
+    ]
+    return sorted(packed, key=lambda entry: (not isinstance(entry[0], int), entry[0]))
+
+
+def compact_puzzle(data):
+    """Convert a puzzle's API dict into the compact wire format.
+
+    ``answers`` becomes one string per row with BLOCK for empty cells (rows
+    with multi-character cells stay lists), and ``cluePositions`` becomes a
+    list of ``[number, row, col, 'a' | 'd', length]`` arrays. Every other
+    field is unchanged, as are answers and positions of unexpected types.
+    """
+    compact = dict(data, format='compact', block=BLOCK)
+
+    if isinstance(data.get('answers'), list):
+        compact['answers'] = [_pack_row(row) for row in data['answers']]
+    if isinstance(data.get('cluePositions'), dict):
+        compact['cluePositions'] = _pack_positions(data['cluePositions'])
+
+    return compact
@@ -0,0 +1,66 @@
+import gzip
+from flask import current_app, request
+from app.utils.http import representation_etag
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def negotiate_encoding(size):
+    """Pick a Content-Encoding for a body of size bytes, or None to send it as-is."""
+    if size < current_app.config['COMPRESS_MIN_SIZE']:
+        return None
+    
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+
+def compress(body, encoding):
+    """Compress body with the given Content-Encoding."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=current_app.config['COMPRESS_BROTLI_QUALITY'])
+    return gzip.compress(body, compresslevel=current_app.config['COMPRESS_GZIP_LEVEL'])
+
+
+def compress_response(response):
+    """after_request hook compressing eligible responses on the fly.
+    
+    Responses that already carry a Content-Encoding (such as precompressed
+    cached puzzles) and streamed responses are left alone. A compressed
+    response gets an ETag suffixed with its encoding so each representation
+    keeps a distinct strong validator.
+    """
+    if response.status_code == 304:
+        # Echo the encoded validator the client revalidated with
+        etag, weak = response.get_etag()
+        encoding = negotiate_encoding(current_app.config['COMPRESS_MIN_SIZE'])
+        if etag and encoding and request.if_none_match.contains(representation_etag(etag, encoding)):
+            response.set_etag(representation_etag(etag, encoding), weak)
+        response.vary.add('Accept-Encoding')
+        return response
+    
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    
+    body = response.get_data()
+    encoding = negotiate_encoding(len(body))
+    if encoding is None:
+        return response
+    
+    response.set_data(compress(body, encoding))
+    response.headers['Content-Encoding'] = encoding
+    
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(representation_etag(etag, encoding), weak)
+    
+    return response
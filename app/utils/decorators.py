@@ -1,19 +1,38 @@
 from functools import wraps
-from flask import request, jsonify, current_app
+from flask import g, request, jsonify, current_app
+
+
+def api_key_error():
+    """Return the error response for a missing or invalid API key, or None."""
+    api_key = request.headers.get('X-API-Key')
+    
+    if not api_key:
+        return jsonify({'error': 'API key is missing'}), 401
+    
+    if api_key != current_app.config['API_KEY']:
+        return jsonify({'error': 'Invalid API key'}), 403
+    
+    return None
 
 
 def require_api_key(f):
     """Decorator to require API key for admin endpoints."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        api_key = request.headers.get('X-API-Key')
-        
-        if not api_key:
-            return jsonify({'error': 'API key is missing'}), 401
-        
-        if api_key != current_app.config['API_KEY']:
-            return jsonify({'error': 'Invalid API key'}), 403
+        error = api_key_error()
+        if error is not None:
+            return error
         
         return f(*args, **kwargs)
     
     return decorated_function
+
+
+def use_replica(f):
+    """Decorator to run a read-only endpoint's queries on the read replica."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        g.use_replica = True
+        return f(*args, **kwargs)
+    
+    return decorated_function
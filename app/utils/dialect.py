@@ -0,0 +1,42 @@
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+
+# INSERT constructs that support ON CONFLICT, by dialect name
+ON_CONFLICT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+# Columns of uq_topic_publish_date, usable as an ON CONFLICT target on every dialect
+TOPIC_DATE_CONFLICT = ('topic', 'publish_date')
+
+
+def dialect_name():
+    """Return the name of the database dialect the session is bound to."""
+    return db.session.get_bind().dialect.name
+
+
+def on_conflict_insert(table):
+    """Return an INSERT for table that supports on_conflict_do_nothing/do_update."""
+    name = dialect_name()
+    if name not in ON_CONFLICT_INSERTS:
+        raise NotImplementedError(f'ON CONFLICT inserts are not supported on {name}')
+    return ON_CONFLICT_INSERTS[name](table)
+
+
+def latest_per_group(query, group_column, order_column):
+    """Keep only the row with the greatest order_column in each group.
+
+    Uses DISTINCT ON on PostgreSQL and a ROW_NUMBER() window elsewhere; the
+    returned query selects the same columns as query.
+    """
+    if dialect_name() == 'postgresql':
+        return query.distinct(group_column).order_by(group_column, order_column.desc())
+
+    ranked = query.add_columns(
+        func.row_number().over(partition_by=group_column, order_by=order_column.desc()).label('row_number')
+    ).subquery()
+
+    columns = [ranked.c[description['name']] for description in query.column_descriptions]
+    return db.session.query(*columns).filter(ranked.c.row_number == 1)
@@ -0,0 +1,28 @@
+from app import db
+from app.models import Puzzle
+
+
+def export_query(topics=None, start_date=None, end_date=None, is_active=None):
+    """Build the (id, payload) query for an archive export."""
+    query = db.session.query(Puzzle.id, Puzzle.payload)
+    
+    if topics:
+        query = query.filter(Puzzle.topic.in_(topics))
+    if start_date:
+        query = query.filter(Puzzle.publish_date >= start_date)
+    if end_date:
+        query = query.filter(Puzzle.publish_date <= end_date)
+    if is_active is not None:
+        query = query.filter(Puzzle.is_active.is_(is_active))
+    
+    return query.order_by(Puzzle.publish_date, Puzzle.topic)
+
+
+def iter_ndjson(query, batch_size=1000):
+    """Yield each exported puzzle as one NDJSON line.
+    
+    yield_per streams rows through a server-side cursor, so memory stays
+    constant and the first line is sent before the whole result is read.
+    """
+    for row in query.yield_per(batch_size):
+        yield Puzzle.stored_payload(row).encode('utf-8') + b'\n'
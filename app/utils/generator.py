@@ -0,0 +1,305 @@
+import random
+import re
+from collections import namedtuple
+
+ACROSS, DOWN = 'across', 'down'
+
+# (row, col) step per cell, and the flag marking a cell as part of a word, by direction
+STEPS = {ACROSS: (0, 1), DOWN: (1, 0)}
+FLAGS = {ACROSS: 1, DOWN: 2}
+
+Placement = namedtuple('Placement', ('word', 'row', 'col', 'direction'))
+
+
+def normalize_word(word):
+    """Upper-case a word list entry, dropping spaces, digits and punctuation."""
+    return re.sub(r'[^A-Z]', '', word.upper())
+
+
+def iter_bits(mask):
+    """Yield the indexes of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class WordIndex:
+    """Bitset index answering "which words fit this pattern?" queries.
+
+    Bit i of ``by_length[n]`` is set when word i has n letters, and bit i of
+    ``by_letter[(n, position, letter)]`` when it has that letter there. A
+    slot with some letters already fixed by crossing words is matched by
+    ANDing one integer per fixed letter.
+    """
+
+    def __init__(self, words):
+        self.words = list(dict.fromkeys(word for word in words if len(word) >= 2))
+        self.by_length = {}
+        self.by_letter = {}
+
+        for index, word in enumerate(self.words):
+            bit = 1 << index
+            length = len(word)
+            self.by_length[length] = self.by_length.get(length, 0) | bit
+            for position, letter in enumerate(word):
+                key = (length, position, letter)
+                self.by_letter[key] = self.by_letter.get(key, 0) | bit
+
+        self.lengths = sorted(self.by_length)
+
+    def matches(self, length, fixed, exclude=0):
+        """Return the bitset of words of length with the {position: letter} fixed."""
+        mask = self.by_length.get(length, 0) & ~exclude
+        for position, letter in fixed.items():
+            if not mask:
+                break
+            mask &= self.by_letter.get((length, position, letter), 0)
+        return mask
+
+
+class CrosswordGenerator:
+    """Builds free-form crosswords (like the seeded puzzles) from a word list.
+
+    The longest words seed the grid; each further word must cross at least
+    one placed word, may only touch others where it crosses them, and is
+    chosen by backtracking over the slots with the most crossings. The
+    search stops at target_words (capped at the size of the word list)
+    or after max_nodes steps, keeping the fullest grid found; branches
+    where no unused word fits end without using up steps.
+    """
+
+    def __init__(self, words, size=12, target_words=12, min_words=6, branching=3, max_nodes=2000):
+        self.index = WordIndex(words)
+        self.size = size
+        self.target_words = min(target_words, len(self.index.words))
+        self.min_words = min_words
+        self.branching = branching
+        self.max_nodes = max_nodes
+
+    def generate(self, rng):
+        """Return a list of Placements, or None if no grid reached min_words."""
+        starts = [
+            index for index, word in enumerate(self.index.words)
+            if self.size // 2 <= len(word) <= self.size
+        ] or [index for index, word in enumerate(self.index.words) if len(word) <= self.size]
+        rng.shuffle(starts)
+
+        best = []
+        for start in starts[:self.branching]:
+            placements = _Search(self, rng).run(start)
+            if len(placements) > len(best):
+                best = placements
+            if len(best) >= self.target_words:
+                break
+
+        return best if len(best) >= self.min_words else None
+
+
+class _Search:
+    """One backtracking search over a grid, starting from a given word.
+
+    ``slots`` maps every slot a word could go in now, as ``(row, col,
+    direction, length)``, to its crossing count and candidate bitset. Each
+    placement only revisits the slots near the new word and adds those
+    through its new letters, and undo restores the previous map.
+    """
+
+    def __init__(self, generator, rng):
+        self.generator = generator
+        self.index = generator.index
+        self.size = generator.size
+        self.rng = rng
+        self.cells = [[None] * self.size for _ in range(self.size)]
+        self.flags = [[0] * self.size for _ in range(self.size)]
+        self.placements = []
+        self.used = 0
+        self.slots = {}
+        self.saved_slots = []
+        self.nodes = 0
+        self.best = []
+
+    def run(self, start):
+        word = self.index.words[start]
+        row = self.size // 2
+        col = (self.size - len(word)) // 2
+        self._place(start, row, col, ACROSS)
+        self._search()
+        return self.best
+
+    def _search(self):
+        if len(self.placements) > len(self.best):
+            self.best = list(self.placements)
+        if len(self.placements) >= self.generator.target_words:
+            return True
+
+        # A dead end: no unused word fits anywhere in the grid
+        if not self.slots:
+            return False
+
+        self.nodes += 1
+        if self.nodes > self.generator.max_nodes:
+            return False
+
+        for (row, col, direction, length), mask in self._options():
+            word = self.rng.choice(list(iter_bits(mask)))
+            undo = self._place(word, row, col, direction)
+            if self._search():
+                return True
+            self._undo(word, undo)
+
+        return False
+
+    def _options(self):
+        """Return the most constrained fitting slots and their candidate words."""
+        options = [(crossings, self.rng.random(), slot, mask) for slot, (crossings, mask) in self.slots.items()]
+        options.sort(reverse=True)
+        return [(slot, mask) for _, _, slot, mask in options[:self.generator.branching]]
+
+    def _update_slots(self, word_bit, placement, written):
+        """Bring slots up to date after placement wrote letters into the written cells."""
+        row, col, direction = placement.row, placement.col, placement.direction
+        step_row, step_col = STEPS[direction]
+        last_row = row + step_row * (len(placement.word) - 1)
+        last_col = col + step_col * (len(placement.word) - 1)
+        slots = {}
+
+        for slot, (crossings, mask) in self.slots.items():
+            slot_row, slot_col, slot_direction, slot_length = slot
+            slot_step_row, slot_step_col = STEPS[slot_direction]
+            slot_last_row = slot_row + slot_step_row * (slot_length - 1)
+            slot_last_col = slot_col + slot_step_col * (slot_length - 1)
+
+            # Only slots within a cell of the new word can have changed
+            if (slot_row - 1 <= last_row and row <= slot_last_row + 1
+                    and slot_col - 1 <= last_col and col <= slot_last_col + 1):
+                self._add_slot(slots, slot)
+            elif mask & ~word_bit:
+                slots[slot] = (crossings, mask & ~word_bit)
+
+        # New slots must cross one of the new letters, across the new word
+        cross = DOWN if direction == ACROSS else ACROSS
+        cross_row, cross_col = STEPS[cross]
+        for cell_row, cell_col in written:
+            for length in self.index.lengths:
+                for offset in range(length):
+                    self._add_slot(slots, (cell_row - cross_row * offset, cell_col - cross_col * offset, cross, length))
+
+        self.slots = slots
+
+    def _add_slot(self, slots, slot):
+        if slot in slots:
+            return
+        fixed = self._fixed_letters(*slot)
+        if fixed is None:
+            return
+        mask = self.index.matches(slot[3], fixed, self.used)
+        if mask:
+            slots[slot] = (len(fixed), mask)
+
+    def _fixed_letters(self, row, col, direction, length):
+        """Return {position: letter} for a slot a word may go in, or None."""
+        step_row, step_col = STEPS[direction]
+        end_row, end_col = row + step_row * (length - 1), col + step_col * (length - 1)
+        if not (0 <= row and 0 <= col and end_row < self.size and end_col < self.size):
+            return None
+
+        # The word must not run into letters before or after it
+        if self._letter(row - step_row, col - step_col) or self._letter(end_row + step_row, end_col + step_col):
+            return None
+
+        fixed = {}
+        for offset in range(length):
+            cell_row, cell_col = row + step_row * offset, col + step_col * offset
+            letter = self.cells[cell_row][cell_col]
+
+            if letter is not None:
+                if self.flags[cell_row][cell_col] & FLAGS[direction]:
+                    return None
+                fixed[offset] = letter
+            elif self._letter(cell_row + step_col, cell_col + step_row) or self._letter(cell_row - step_col, cell_col - step_row):
+                # A new letter beside an existing one would form an unintended word
+                return None
+
+        if not fixed or len(fixed) == length:
+            return None
+        return fixed
+
+    def _letter(self, row, col):
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return self.cells[row][col]
+        return None
+
+    def _place(self, word_index, row, col, direction):
+        """Write a word into the grid; return the cells that were empty before."""
+        word = self.index.words[word_index]
+        step_row, step_col = STEPS[direction]
+        written = []
+
+        for offset, letter in enumerate(word):
+            cell_row, cell_col = row + step_row * offset, col + step_col * offset
+            if self.cells[cell_row][cell_col] is None:
+                self.cells[cell_row][cell_col] = letter
+                written.append((cell_row, cell_col))
+            self.flags[cell_row][cell_col] |= FLAGS[direction]
+
+        self.placements.append(Placement(word, row, col, direction))
+        self.used |= 1 << word_index
+        self.saved_slots.append(self.slots)
+        self._update_slots(1 << word_index, self.placements[-1], written)
+        return written
+
+    def _undo(self, word_index, written):
+        placement = self.placements.pop()
+        step_row, step_col = STEPS[placement.direction]
+
+        for offset in range(len(placement.word)):
+            self.flags[placement.row + step_row * offset][placement.col + step_col * offset] &= ~FLAGS[placement.direction]
+        for cell_row, cell_col in written:
+            self.cells[cell_row][cell_col] = None
+
+        self.used &= ~(1 << word_index)
+        self.slots = self.saved_slots.pop()
+
+
+def puzzle_fields(placements, size, clues=None):
+    """Build grid_data, clue_positions and clues for placed words.
+
+    Clues are numbered in reading order, across before down, with one
+    number per word (the schema keys clue positions by number alone).
+    Words without an entry in clues get a placeholder.
+    """
+    clues = clues or {}
+    grid_data = [[None] * size for _ in range(size)]
+    clue_positions = {}
+    across_clues = {}
+    down_clues = {}
+
+    ordered = sorted(placements, key=lambda placement: (placement.row, placement.col, placement.direction != ACROSS))
+
+    for number, placement in enumerate(ordered, start=1):
+        step_row, step_col = STEPS[placement.direction]
+        for offset, letter in enumerate(placement.word):
+            grid_data[placement.row + step_row * offset][placement.col + step_col * offset] = letter
+
+        clue_positions[str(number)] = {
+            'row': placement.row,
+            'col': placement.col,
+            'direction': placement.direction,
+            'length': len(placement.word)
+        }
+        clue = clues.get(placement.word) or f'({len(placement.word)} letters)'
+        (across_clues if placement.direction == ACROSS else down_clues)[str(number)] = clue
+
+    return {
+        'grid_size': size,
+        'grid_data': grid_data,
+        'across_clues': across_clues,
+        'down_clues': down_clues,
+        'clue_positions': clue_positions
+    }
+
+
+def day_rng(seed, topic, publish_date):
+    """Return a Random seeded per topic and day, so reruns reproduce a puzzle."""
+    return random.Random(f'{seed}:{topic}:{publish_date.isoformat()}')
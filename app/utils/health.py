@@ -0,0 +1,63 @@
+import threading
+import time
+from app import db
+
+
+def pool_stats(engine):
+    """Report an engine's connection pool usage, for the pools that track it."""
+    pool = engine.pool
+    stats = {}
+
+    for name, attribute in (('size', 'size'), ('checkedOut', 'checkedout'), ('checkedIn', 'checkedin'), ('overflow', 'overflow')):
+        method = getattr(pool, attribute, None)
+        if method is not None:
+            stats[name] = method()
+
+    return stats
+
+
+class DatabaseProbe:
+    """Runs SELECT 1 against every bound engine at most once per interval.
+
+    Callers in between get the last result, and while one thread probes the
+    others keep returning it instead of queueing for a connection.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._result = None
+        self._checked_at = None
+
+    def result(self):
+        """Return (probe results by bind, seconds since the probe ran)."""
+        stale = self._checked_at is None or time.monotonic() - self._checked_at >= self.interval
+
+        # Only block when there is no earlier result to fall back on
+        if stale and self._lock.acquire(blocking=self._result is None):
+            try:
+                self._result = self._probe()
+                self._checked_at = time.monotonic()
+            finally:
+                self._lock.release()
+
+        return self._result, time.monotonic() - self._checked_at
+
+    def _probe(self):
+        results = {}
+
+        for bind, engine in db.engines.items():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    connection.execute(db.text('SELECT 1'))
+                status = 'healthy'
+            except Exception as e:
+                status = f'unhealthy: {str(e)}'
+
+            results[bind or 'primary'] = {
+                'status': status,
+                'latencyMs': round((time.perf_counter() - started) * 1000, 2)
+            }
+
+        return results
@@ -0,0 +1,55 @@
+import hashlib
+from datetime import date, datetime, time, timedelta
+from flask import Response, request
+
+# Content-Encodings a response body may be compressed with
+CONTENT_ENCODINGS = ('gzip', 'br')
+
+
+def puzzle_etag(puzzle_id, updated_at):
+    """Build a strong ETag from a puzzle's id and last update time."""
+    revision = f'{puzzle_id}:{updated_at.isoformat() if updated_at else ""}'
+    return hashlib.sha1(revision.encode('utf-8')).hexdigest()
+
+
+def representation_etag(etag, representation=None):
+    """Derive the ETag of another representation (e.g. 'compact') of a revision."""
+    return f'{etag}-{representation}' if representation else etag
+
+
+def etag_matches(etag):
+    """Check If-None-Match against etag and its content-encoded variants."""
+    if_none_match = request.if_none_match
+    return if_none_match.contains(etag) or any(
+        if_none_match.contains(representation_etag(etag, encoding))
+        for encoding in CONTENT_ENCODINGS
+    )
+
+
+def combined_etag(etags):
+    """Build a strong ETag for a response made of several puzzles."""
+    return hashlib.sha1(':'.join(etags).encode('utf-8')).hexdigest()
+
+
+def next_rollover(today=None):
+    """Return the (local, timezone-aware) moment the daily puzzle changes."""
+    today = today or date.today()
+    return datetime.combine(today + timedelta(days=1), time.min).astimezone()
+
+
+def apply_cache_headers(response, etag):
+    """Mark a public puzzle response as cacheable until the next rollover."""
+    rollover = next_rollover()
+    max_age = max(int((rollover - datetime.now().astimezone()).total_seconds()), 0)
+
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.expires = rollover
+
+    return response
+
+
+def not_modified(etag):
+    """Build a 304 response for a matching conditional request."""
+    return apply_cache_headers(Response(status=304), etag)
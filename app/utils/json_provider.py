@@ -0,0 +1,69 @@
+import json
+import uuid
+from datetime import date, datetime
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_ENCODERS = ('auto', 'orjson', 'stdlib')
+
+
+def _default(obj):
+    """Encode the non-JSON values that appear on puzzle rows."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that uses orjson when available and stdlib json otherwise.
+
+    Output is always compact. UUIDs are encoded as strings and dates and
+    datetimes as ISO 8601 in both modes, so the encoder can be switched
+    without changing the response format.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+
+        encoder = app.config.get('JSON_ENCODER', 'auto')
+        if encoder not in JSON_ENCODERS:
+            raise ValueError(f'JSON_ENCODER must be one of: {", ".join(JSON_ENCODERS)}')
+        if encoder == 'orjson' and orjson is None:
+            raise RuntimeError('JSON_ENCODER is "orjson" but orjson is not installed')
+
+        self.encoder = 'orjson' if encoder != 'stdlib' and orjson is not None else 'stdlib'
+
+    def _orjson_options(self):
+        return orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+
+    def dumps_bytes(self, obj):
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        if self.encoder == 'orjson':
+            return orjson.dumps(obj, default=_default, option=self._orjson_options())
+        return self.dumps(obj).encode('utf-8')
+
+    def dumps(self, obj, **kwargs):
+        if self.encoder == 'orjson' and not kwargs:
+            return orjson.dumps(obj, default=_default, option=self._orjson_options()).decode('utf-8')
+
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        kwargs.setdefault('separators', (',', ':'))
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.encoder == 'orjson' and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
@@ -0,0 +1,148 @@
+import logging
+import os
+import time
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+from app import db, puzzle_cache
+from app.utils.health import pool_stats
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+logger = logging.getLogger(__name__)
+
+# Requests that matched no route share one label, keeping cardinality bounded
+UNMATCHED_ENDPOINT = 'unmatched'
+
+if prometheus_client is not None:
+    REQUESTS = prometheus_client.Counter(
+        'http_requests_total', 'HTTP requests by endpoint, method and status code',
+        ('endpoint', 'method', 'status')
+    )
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        'http_request_duration_seconds', 'HTTP request latency by endpoint',
+        ('endpoint', 'method'),
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    )
+    REQUEST_QUERIES = prometheus_client.Histogram(
+        'http_request_sql_queries', 'SQL statements executed per request',
+        ('endpoint',),
+        buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100)
+    )
+    REQUEST_SQL_TIME = prometheus_client.Histogram(
+        'http_request_sql_duration_seconds', 'Time spent in SQL statements per request',
+        ('endpoint',),
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+    )
+    # livesum adds up the values of the workers that are still running
+    POOL_CHECKED_OUT = prometheus_client.Gauge(
+        'db_pool_checked_out', 'Connections currently checked out of the pool',
+        ('bind',), multiprocess_mode='livesum'
+    )
+    POOL_OVERFLOW = prometheus_client.Gauge(
+        'db_pool_overflow', 'Connections open beyond the pool size (negative while below it)',
+        ('bind',), multiprocess_mode='livesum'
+    )
+    CACHE_LOOKUPS = prometheus_client.Counter(
+        'puzzle_cache_lookups_total', 'Puzzle cache lookups by result',
+        ('result',)
+    )
+
+
+def _endpoint():
+    return request.endpoint or UNMATCHED_ENDPOINT
+
+
+def _before_request():
+    g.metrics_started = time.perf_counter()
+    g.sql_queries = 0
+    g.sql_seconds = 0.0
+
+
+def _after_request(response):
+    started = g.pop('metrics_started', None)
+    if started is None:
+        return response
+
+    endpoint = _endpoint()
+    REQUESTS.labels(endpoint, request.method, response.status_code).inc()
+    REQUEST_LATENCY.labels(endpoint, request.method).observe(time.perf_counter() - started)
+    REQUEST_QUERIES.labels(endpoint).observe(g.pop('sql_queries', 0))
+    REQUEST_SQL_TIME.labels(endpoint).observe(g.pop('sql_seconds', 0.0))
+
+    return response
+
+
+def _instrument_engine(bind, engine):
+    """Time statements for the current request and track pool usage."""
+    label = bind or 'primary'
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('metrics_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['metrics_started'].pop()
+        if has_request_context() and 'sql_queries' in g:
+            g.sql_queries += 1
+            g.sql_seconds += elapsed
+
+    # checkin fires before the pool counts the connection as returned, so
+    # track checkouts directly rather than reading pool.checkedout() there
+    def checkout(*args):
+        POOL_CHECKED_OUT.labels(label).inc()
+        stats = pool_stats(engine)
+        if 'overflow' in stats:
+            POOL_OVERFLOW.labels(label).set(stats['overflow'])
+
+    def checkin(*args):
+        POOL_CHECKED_OUT.labels(label).dec()
+
+    # Pool events registered on the engine survive engine.dispose() after fork
+    event.listen(engine, 'checkout', checkout)
+    event.listen(engine, 'checkin', checkin)
+
+
+def _record_cache_lookup(local_hits, shared_hits, misses):
+    for result, count in (('local_hit', local_hits), ('shared_hit', shared_hits), ('miss', misses)):
+        if count:
+            CACHE_LOOKUPS.labels(result).inc(count)
+
+
+def metrics_view():
+    """Expose the metrics of every worker in the Prometheus text format."""
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+
+    return Response(prometheus_client.generate_latest(registry), mimetype=prometheus_client.CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app):
+    """Instrument requests, engines and the puzzle cache, and add GET /metrics.
+
+    Under gunicorn, PROMETHEUS_MULTIPROC_DIR (set by gunicorn.conf.py) must
+    exist before prometheus_client is imported so every worker writes its
+    samples there and /metrics reports the sum across workers.
+    """
+    if prometheus_client is None:
+        logger.warning('METRICS_ENABLED is set but prometheus_client is not installed')
+        return
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            _instrument_engine(bind, engine)
+    # Engines created later (the ASGI app's async engine) are instrumented too
+    app.extensions.setdefault('engine_listeners', []).append(_instrument_engine)
+
+    puzzle_cache.on_lookup = _record_cache_lookup
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
@@ -0,0 +1,107 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+import uuid
+from datetime import datetime
+from flask import Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+from app import db
+from app.utils.decorators import api_key_error
+
+slow_query_logger = logging.getLogger('app.slow_queries')
+
+PROFILE_HEADER = 'X-Profile'
+
+# Orderings accepted as the X-Profile header value ('1' means cumulative)
+PROFILE_SORT_KEYS = ('cumulative', 'tottime', 'calls')
+
+# Longest parameter repr written to the slow-query log
+MAX_PARAMETERS_LENGTH = 1000
+
+
+def _start_profiler():
+    requested = request.headers.get(PROFILE_HEADER)
+    if not requested:
+        return None
+
+    # Profiles expose internals, so they need the admin key even on public routes
+    error = api_key_error()
+    if error is not None:
+        return error
+
+    sort_key = requested if requested in PROFILE_SORT_KEYS else 'cumulative'
+    g.profile = (cProfile.Profile(), sort_key)
+    g.profile[0].enable()
+    return None
+
+
+def _finish_profiler(response):
+    profile = g.pop('profile', None)
+    if profile is None:
+        return response
+
+    profiler, sort_key = profile
+    profiler.disable()
+
+    profile_dir = current_app.config.get('PROFILE_DIR')
+    if profile_dir:
+        # Keep the response and store the raw stats for snakeviz / pstats
+        os.makedirs(profile_dir, exist_ok=True)
+        filename = f'{datetime.utcnow():%Y%m%dT%H%M%S}-{request.endpoint}-{uuid.uuid4().hex[:8]}.prof'
+        profiler.dump_stats(os.path.join(profile_dir, filename))
+        response.headers['X-Profile-File'] = filename
+        return response
+
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats(sort_key).print_stats(current_app.config['PROFILE_REPORT_LINES'])
+
+    profiled = Response(report.getvalue(), mimetype='text/plain')
+    profiled.headers['X-Profile-Status'] = str(response.status_code)
+    return profiled
+
+
+def init_profiling(app):
+    """Profile single requests that send an X-Profile header and a valid API key.
+
+    The report replaces the response body, or with PROFILE_DIR set is stored
+    there as a .prof file named in the X-Profile-File header. Streamed bodies
+    (e.g. the export) are produced after the profiler stops.
+    """
+    app.before_request(_start_profiler)
+    app.after_request(_finish_profiler)
+
+
+def _route():
+    if has_request_context():
+        return f'{request.method} {request.path} ({request.endpoint})'
+    return 'background'
+
+
+def init_slow_query_log(app):
+    """Log every statement slower than SLOW_QUERY_THRESHOLD_MS with its route."""
+    threshold = app.config['SLOW_QUERY_THRESHOLD_MS'] / 1000
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('slow_query_started', []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['slow_query_started'].pop()
+        if elapsed < threshold:
+            return
+
+        slow_query_logger.warning(
+            'Slow query (%.1f ms) in %s: %s; parameters: %s',
+            elapsed * 1000, _route(), statement, repr(parameters)[:MAX_PARAMETERS_LENGTH]
+        )
+
+    def listen(bind, engine):
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            listen(bind, engine)
+    app.extensions.setdefault('engine_listeners', []).append(listen)
@@ -0,0 +1,162 @@
+from datetime import date, datetime
+from flask import Response, current_app, request
+from app import puzzle_cache
+from app.models import Puzzle
+from app.utils.cache import CachedPuzzle
+from app.utils.compact import COMPACT_MIMETYPE, compact_puzzle
+from app.utils.compression import compress, negotiate_encoding
+from app.utils.http import (
+    apply_cache_headers, etag_matches, not_modified, puzzle_etag, representation_etag
+)
+
+
+def daily_puzzle_query(topic, today):
+    """Query today's puzzle for a topic, falling back to the most recent one."""
+    return Puzzle.query.filter_by(
+        topic=topic,
+        is_active=True
+    ).filter(
+        Puzzle.publish_date <= today
+    ).order_by(
+        Puzzle.publish_date.desc()
+    )
+
+
+def revision_query(query):
+    """Narrow a puzzle query to the (id, updated_at) of its first match, for a 304 check."""
+    return query.with_entities(Puzzle.id, Puzzle.updated_at).limit(1)
+
+
+def payload_query(query):
+    """Narrow a puzzle query to the (id, updated_at, payload) of its first match.
+
+    The stored payload comes back as plain columns, skipping ORM hydration.
+    """
+    return query.with_entities(Puzzle.id, Puzzle.updated_at, Puzzle.payload).limit(1)
+
+
+def cache_row(cache_key, row, ttl=None):
+    """Cache the response body for a (id, updated_at, payload) row."""
+    body = Puzzle.stored_payload(row).encode('utf-8')
+    cached = CachedPuzzle(puzzle_etag(row.id, row.updated_at), body)
+    puzzle_cache.set(cache_key, cached, ttl)
+    return cached
+
+
+def requested_format():
+    """Return the requested public representation: None (plain JSON) or a variant name.
+
+    The format is chosen by ``?format=`` or, failing that, by the Accept
+    header; ``?answers=false`` drops the answer grid (see POST /check).
+    Variant names join 'compact' and 'noanswers' with '-'. Raises
+    ValueError for an unknown format.
+    """
+    response_format = request.args.get('format')
+
+    if response_format is None:
+        best = request.accept_mimetypes.best_match(['application/json', COMPACT_MIMETYPE])
+        response_format = 'compact' if best == COMPACT_MIMETYPE else 'json'
+    if response_format not in ('json', 'compact'):
+        raise ValueError('Invalid format. Use json or compact')
+
+    parts = [] if response_format == 'json' else [response_format]
+    if request.args.get('answers', '').lower() in ('0', 'false', 'no'):
+        parts.append('noanswers')
+
+    return '-'.join(parts) or None
+
+
+def is_compact(response_format):
+    return bool(response_format) and 'compact' in response_format.split('-')
+
+
+def _variant_body(body, response_format):
+    """Build the body of a variant representation from the stored payload."""
+    data = current_app.json.loads(body)
+
+    if 'noanswers' in response_format.split('-'):
+        data.pop('answers', None)
+    if is_compact(response_format):
+        data = compact_puzzle(data)
+
+    return current_app.json.dumps_bytes(data)
+
+
+def select_representation(cached, response_format):
+    """Return the (etag, body) of a cached puzzle in the requested format."""
+    if response_format:
+        return cached.variant(response_format, lambda: _variant_body(cached.body, response_format))
+    return cached.etag, cached.body
+
+
+def encoded_representation(cached, response_format):
+    """Return (etag, body, encoding), compressing once per cache entry.
+
+    The compressed bytes are kept on the cache entry, so hot puzzles only
+    pay compression CPU when they are (re)loaded.
+    """
+    etag, body = select_representation(cached, response_format)
+
+    encoding = negotiate_encoding(len(body))
+    if encoding is None:
+        return etag, body, None
+
+    name = f'{response_format}-{encoding}' if response_format else encoding
+    etag, body = cached.variant(name, lambda: compress(body, encoding))
+    return etag, body, encoding
+
+
+def vary_on_format(response):
+    """Mark responses whose format was negotiated from the Accept header."""
+    if 'format' not in request.args:
+        response.vary.add('Accept')
+    return response
+
+
+def format_response(body, etag, response_format, encoding=None):
+    mimetype = COMPACT_MIMETYPE if is_compact(response_format) else 'application/json'
+    response = apply_cache_headers(Response(body, mimetype=mimetype), etag)
+
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+
+    return vary_on_format(response)
+
+
+def revision_not_modified(revision, response_format=None):
+    """Return a 304 if an (id, updated_at) revision matches If-None-Match, else None."""
+    etag = representation_etag(puzzle_etag(revision.id, revision.updated_at), response_format)
+    if etag_matches(etag):
+        return vary_on_format(not_modified(etag))
+    return None
+
+
+def cached_puzzle_response(cached, response_format=None):
+    """Serve a cached puzzle in the requested format, or a 304 if it still matches."""
+    etag, body = select_representation(cached, response_format)
+    if etag_matches(etag):
+        return vary_on_format(not_modified(etag))
+
+    etag, body, encoding = encoded_representation(cached, response_format)
+    return format_response(body, etag, response_format, encoding)
+
+
+def daily_lookup():
+    """Return the cache key and query for a single-topic daily puzzle request."""
+    topic = request.args.get('topic', 'shopping')
+    today = date.today()
+    return ('daily', topic, today), daily_puzzle_query(topic, today)
+
+
+def date_lookup():
+    """Return the cache key and query for a single-date puzzle request.
+
+    Raises ValueError when the date parameter is missing or malformed.
+    """
+    topic = request.args.get('topic', 'shopping')
+    puzzle_date = datetime.strptime(request.args.get('date', ''), '%Y-%m-%d').date()
+    return (
+        ('date', topic, puzzle_date),
+        Puzzle.query.filter_by(topic=topic, publish_date=puzzle_date, is_active=True)
+    )
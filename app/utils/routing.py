@@ -0,0 +1,22 @@
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+
+# SQLALCHEMY_BINDS key of the optional read replica
+REPLICA_BIND = 'replica'
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the read replica when the request allows it.
+
+    Routes opt in with the use_replica decorator. Flushes, and therefore
+    every write, always go to the primary, as does everything when no
+    replica bind is configured.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get('use_replica'):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
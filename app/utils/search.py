@@ -0,0 +1,155 @@
+import math
+import re
+import threading
+from collections import defaultdict
+from flask import current_app
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects import postgresql
+from app import db
+from app.models import SEARCH_CONFIG, SEARCH_VECTOR_SQL, Puzzle
+from app.utils.dialect import dialect_name
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(value):
+    """Split text into lower-case alphanumeric tokens."""
+    return TOKEN_PATTERN.findall(value.lower())
+
+
+class InvertedIndex:
+    """In-memory inverted index over Puzzle.search_text for non-PostgreSQL databases.
+
+    Built on first use and brought up to date before each search from the
+    rows updated since the last sync. Only when the table's row count then
+    differs from the number of indexed puzzles are the stored ids compared
+    with the table's, so puzzles deleted by any process are dropped and rows
+    the timestamp scan missed are indexed. Scores are TF-IDF sums, and every
+    query token must match.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        self.documents = {}
+        self.synced_through = None
+        self._lock = threading.Lock()
+
+    def sync(self):
+        with self._lock:
+            self._index(self._rows(self.synced_through))
+
+            if db.session.query(func.count(Puzzle.id)).scalar() == len(self.documents):
+                return
+
+            ids = {row.id for row in db.session.query(Puzzle.id)}
+            for puzzle_id in self.documents.keys() - ids:
+                self._remove(puzzle_id)
+
+            missing = ids - self.documents.keys()
+            if missing:
+                self._index(self._rows().filter(Puzzle.id.in_(missing)))
+
+    def _rows(self, since=None):
+        query = db.session.query(
+            Puzzle.id, Puzzle.topic, Puzzle.publish_date, Puzzle.updated_at, Puzzle.search_text
+        )
+        # Rows sharing the newest timestamp are re-read; indexing them again is harmless
+        if since is not None:
+            query = query.filter(Puzzle.updated_at >= since)
+        return query
+
+    def _index(self, rows):
+        for row in rows:
+            self._add(row)
+            if row.updated_at and (self.synced_through is None or row.updated_at > self.synced_through):
+                self.synced_through = row.updated_at
+
+    def _remove(self, puzzle_id):
+        previous = self.documents.pop(puzzle_id, None)
+        if previous is not None:
+            for token in previous[2]:
+                self.postings[token].pop(puzzle_id, None)
+
+    def _add(self, row):
+        self._remove(row.id)
+
+        frequencies = defaultdict(int)
+        for token in tokenize(row.search_text or ''):
+            frequencies[token] += 1
+
+        self.documents[row.id] = (row.topic, row.publish_date, frozenset(frequencies))
+        for token, frequency in frequencies.items():
+            self.postings[token][row.id] = frequency
+
+    def search(self, query, topic=None, limit=20, offset=0):
+        """Return [(id, score)] for the best matches, best first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            postings = sorted((self.postings.get(token, {}) for token in tokens), key=len)
+            if not postings[0]:
+                return []
+
+            total = len(self.documents)
+            scores = {}
+            for puzzle_id in postings[0]:
+                if topic is not None and self.documents[puzzle_id][0] != topic:
+                    continue
+                if all(puzzle_id in posting for posting in postings[1:]):
+                    scores[puzzle_id] = sum(
+                        posting[puzzle_id] * math.log(1 + total / len(posting)) for posting in postings
+                    )
+
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], -self.documents[item[0]][1].toordinal()))
+
+        return ranked[offset:offset + limit]
+
+
+def search_stems(words):
+    """Map each word to the lexemes a search for it matches.
+
+    PostgreSQL stems words and drops stop words the way the search index
+    does ("running" -> {"run"}, "the" -> empty); the in-memory index matches
+    tokens as they are, so elsewhere each word maps to itself.
+    """
+    words = list(dict.fromkeys(words))
+    if not words or dialect_name() != 'postgresql':
+        return {word: frozenset([word]) for word in words}
+
+    word = func.unnest(postgresql.array(words, type_=db.Text)).column_valued('word')
+    lexemes = func.tsvector_to_array(
+        func.to_tsvector(literal_column(f"'{SEARCH_CONFIG}'"), word), type_=postgresql.ARRAY(db.Text)
+    )
+    return {row[0]: frozenset(row[1]) for row in db.session.execute(select(word, lexemes))}
+
+
+def _search_postgres(query, topic, limit, offset):
+    """Rank matches with ts_rank over the GIN-indexed tsvector expression."""
+    vector = literal_column(SEARCH_VECTOR_SQL)
+    tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), query)
+    rank = func.ts_rank(vector, tsquery).label('rank')
+
+    statement = db.session.query(Puzzle.id, rank).filter(vector.op('@@')(tsquery))
+    if topic is not None:
+        statement = statement.filter(Puzzle.topic == topic)
+
+    rows = statement.order_by(
+        rank.desc(), Puzzle.publish_date.desc(), Puzzle.id
+    ).limit(limit).offset(offset)
+
+    return [(row.id, row.rank) for row in rows]
+
+
+def search_puzzles(query, topic=None, limit=20, offset=0):
+    """Return [(id, score)] for puzzles whose clues or answers match query, best first."""
+    if dialect_name() == 'postgresql':
+        return _search_postgres(query, topic, limit, offset)
+
+    index = current_app.extensions.get('search_index')
+    if index is None:
+        index = current_app.extensions['search_index'] = InvertedIndex()
+
+    index.sync()
+    return index.search(query, topic, limit, offset)
@@ -0,0 +1,136 @@
+import logging
+import re
+
+try:
+    import redis
+    from redis.exceptions import RedisError
+except ImportError:
+    redis = None
+    RedisError = OSError
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_BACKENDS = ('none', 'redis')
+
+# Key kinds used by PuzzleCache, and a glob matching an ISO date
+CACHE_KINDS = ('daily', 'date')
+DATE_PATTERN = '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+
+# Separates the ETag from the body in a stored value (ETags are hex digests)
+SEPARATOR = b'\n'
+
+
+def _glob_escape(value):
+    return re.sub(r'([*?\[\]\\])', r'\\\1', value)
+
+
+class RedisPuzzleStore:
+    """Puzzle bodies shared by every worker through a Redis-protocol server.
+
+    Each entry is stored once as ``etag\\nbody`` under
+    ``<prefix><kind>:<topic>:<date>`` with the entry's TTL. Any client with
+    redis-py's get/set/pttl/exists/scan_iter/delete/pipeline interface works, so
+    tests can pass an in-memory stand-in such as fakeredis.
+
+    Server errors are logged and treated as misses; the per-process cache
+    and the database keep serving requests.
+    """
+
+    def __init__(self, client, prefix='cloverkit:puzzles:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_config(cls, config):
+        """Connect to PUZZLE_CACHE_REDIS_URL, or return None if redis-py is missing."""
+        if redis is None:
+            logger.warning('PUZZLE_CACHE_BACKEND is redis but redis-py is not installed')
+            return None
+
+        timeout = config.get('PUZZLE_CACHE_REDIS_TIMEOUT', 0.25)
+        client = redis.Redis.from_url(
+            config['PUZZLE_CACHE_REDIS_URL'],
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout
+        )
+        return cls(client, config.get('PUZZLE_CACHE_REDIS_PREFIX', 'cloverkit:puzzles:'))
+
+    def _key(self, key):
+        kind, topic, day = key
+        return f'{self.prefix}{kind}:{topic}:{day.isoformat()}'
+
+    def _written_key(self, topic):
+        return f'{self.prefix}written:{topic}'
+
+    def get_many(self, keys):
+        """Return {key: (etag, body, seconds left)} for the keys that are stored."""
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        pipeline = self.client.pipeline(transaction=False)
+        for key in keys:
+            redis_key = self._key(key)
+            pipeline.get(redis_key)
+            pipeline.pttl(redis_key)
+
+        try:
+            results = pipeline.execute()
+        except RedisError:
+            logger.warning('Shared puzzle cache read failed', exc_info=True)
+            return {}
+
+        found = {}
+        for index, key in enumerate(keys):
+            value, ttl = results[2 * index], results[2 * index + 1]
+            if value is None or SEPARATOR not in value:
+                continue
+
+            etag, body = value.split(SEPARATOR, 1)
+            # pttl is -1 for keys without an expiry
+            found[key] = (etag.decode('ascii'), body, ttl / 1000 if ttl > 0 else None)
+
+        return found
+
+    def set(self, key, etag, body, ttl):
+        """Store a response body and its ETag for ttl seconds."""
+        try:
+            self.client.set(self._key(key), etag.encode('ascii') + SEPARATOR + body, px=max(int(ttl * 1000), 1))
+        except RedisError:
+            logger.warning('Shared puzzle cache write failed', exc_info=True)
+
+    def invalidate_topic(self, *topics):
+        """Delete every stored entry for the given topics."""
+        try:
+            for topic in topics:
+                stale_keys = [
+                    stale_key
+                    for kind in CACHE_KINDS
+                    for stale_key in self.client.scan_iter(
+                        match=f'{_glob_escape(self.prefix)}{kind}:{_glob_escape(topic)}:{DATE_PATTERN}',
+                        count=500
+                    )
+                ]
+                if stale_keys:
+                    self.client.delete(*stale_keys)
+        except RedisError:
+            logger.warning('Shared puzzle cache invalidation failed', exc_info=True)
+
+    def mark_written(self, topics, seconds):
+        """Flag topics as recently written, for every worker, for the given seconds."""
+        pipeline = self.client.pipeline(transaction=False)
+        for topic in topics:
+            pipeline.set(self._written_key(topic), b'1', px=max(int(seconds * 1000), 1))
+
+        try:
+            pipeline.execute()
+        except RedisError:
+            logger.warning('Shared puzzle cache write marker failed', exc_info=True)
+
+    def recently_written(self, topics):
+        """Return whether any topic is still flagged by mark_written."""
+        try:
+            return self.client.exists(*[self._written_key(topic) for topic in topics]) > 0
+        except RedisError:
+            logger.warning('Shared puzzle cache read failed', exc_info=True)
+            return False
@@ -0,0 +1,116 @@
+import codecs
+import itertools
+import json
+
+
+class RecordError(ValueError):
+    """A single record in a streamed upload could not be decoded."""
+
+
+def _iter_text_chunks(stream, chunk_size):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield decoder.decode(chunk)
+
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _iter_ndjson(chunks, head, max_record_size):
+    buffer = ''
+
+    for chunk in itertools.chain([head], chunks):
+        buffer += chunk
+        *lines, buffer = buffer.split('\n')
+
+        for line in lines:
+            if line.strip():
+                yield _decode_line(line)
+
+        if len(buffer) > max_record_size:
+            yield RecordError(f'Record exceeds {max_record_size} characters')
+            return
+
+    if buffer.strip():
+        yield _decode_line(buffer)
+
+
+def _decode_line(line):
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        return RecordError(f'Invalid JSON: {e}')
+
+
+def _iter_json_array(chunks, buffer, max_record_size):
+    decoder = json.JSONDecoder()
+    position = buffer.index('[') + 1
+    exhausted = False
+
+    while True:
+        # Skip separators between elements
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+
+        if position < len(buffer) and buffer[position] == ']':
+            return
+
+        if position < len(buffer):
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if exhausted:
+                    yield RecordError(f'Invalid JSON: {e}')
+                    return
+            else:
+                # Only accept a record once something follows it, so a number
+                # or string split across chunks is never decoded half-read
+                if end < len(buffer) or exhausted:
+                    yield record
+                    buffer, position = buffer[end:], 0
+                    continue
+
+        if exhausted:
+            yield RecordError('Unexpected end of JSON array')
+            return
+
+        if len(buffer) - position > max_record_size:
+            yield RecordError(f'Record exceeds {max_record_size} characters')
+            return
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+        else:
+            buffer, position = buffer[position:] + chunk, 0
+
+
+def iter_json_records(stream, chunk_size=64 * 1024, max_record_size=1024 * 1024):
+    """Incrementally decode records from a JSON array or NDJSON byte stream.
+
+    Yields each decoded record, or a RecordError in its place when a record
+    is malformed. NDJSON continues with the next line after an error; a
+    malformed JSON array (or a record over max_record_size) ends the stream.
+    Only the record currently being decoded is held in memory.
+    """
+    chunks = _iter_text_chunks(stream, chunk_size)
+    buffer = ''
+
+    # Sniff the first non-whitespace character to pick the format
+    for chunk in chunks:
+        buffer += chunk
+        if buffer.strip():
+            break
+
+    if not buffer.strip():
+        return
+
+    if buffer.lstrip().startswith('['):
+        yield from _iter_json_array(chunks, buffer, max_record_size)
+    else:
+        yield from _iter_ndjson(chunks, buffer, max_record_size)
@@ -0,0 +1,109 @@
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from app import db, puzzle_cache
+from app.api.puzzles import resolve_daily_puzzles
+from app.models import Puzzle
+from app.utils.http import next_rollover
+
+logger = logging.getLogger(__name__)
+
+
+def _seconds_until_rollover():
+    return (next_rollover() - datetime.now().astimezone()).total_seconds()
+
+
+def warm_puzzle_cache():
+    """Load today's and tomorrow's daily puzzle for every active topic.
+    
+    Entries are reloaded even if already cached. Tomorrow's entries are kept
+    past the rollover so the first requests of the new day are cache hits.
+    Returns the number of topics warmed.
+    """
+    topics = [
+        row.topic for row in
+        db.session.query(Puzzle.topic).filter(Puzzle.is_active.is_(True)).distinct()
+    ]
+    if not topics:
+        return 0
+    
+    today = date.today()
+    resolve_daily_puzzles(topics, today, refresh=True)
+    resolve_daily_puzzles(
+        topics,
+        today + timedelta(days=1),
+        refresh=True,
+        ttl=_seconds_until_rollover() + puzzle_cache.ttl
+    )
+    
+    return len(topics)
+
+
+class CacheScheduler:
+    """Background thread that keeps the daily puzzle cache warm.
+    
+    It refreshes every CACHE_REFRESH_INTERVAL seconds and also wakes just
+    after each midnight rollover, so the new day's entries are swapped in
+    before requests need them.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+        self.interval = app.config['CACHE_REFRESH_INTERVAL']
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def warm(self):
+        """Warm the cache now, logging rather than raising on failure."""
+        with self.app.app_context():
+            try:
+                topics = warm_puzzle_cache()
+                logger.info('Warmed puzzle cache for %d topic(s)', topics)
+            except Exception:
+                logger.exception('Puzzle cache warm-up failed')
+            finally:
+                db.session.remove()
+    
+    def start(self):
+        """Start the refresh thread, or restart it in a freshly forked worker."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        # A fresh event, since one inherited across fork may be set or locked
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='puzzle-cache-scheduler', daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout=5):
+        """Stop the refresh thread, waiting up to timeout for a running refresh."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+    
+    def _seconds_until_next_run(self):
+        # Wake a second after midnight so date.today() already returns the new day
+        return max(min(self.interval, _seconds_until_rollover() + 1), 1)
+    
+    def _run(self):
+        while not self._stop.wait(self._seconds_until_next_run()):
+            self.warm()
+
+
+def start_cache_scheduler(app):
+    """Warm the cache and start the refresh thread for a serving process.
+    
+    Called from server startup hooks (gunicorn workers, the ASGI lifespan,
+    run.py) rather than create_app, so CLI commands stay free of
+    background work. Does nothing unless CACHE_WARMUP is set and the cache
+    is enabled, and reuses the process's scheduler if it already has one.
+    """
+    if not app.config.get('CACHE_WARMUP') or not puzzle_cache.enabled:
+        return None
+    
+    scheduler = app.extensions.get('cache_scheduler')
+    if scheduler is None:
+        scheduler = app.extensions['cache_scheduler'] = CacheScheduler(app)
+        scheduler.warm()
+    
+    scheduler.start()
+    return scheduler
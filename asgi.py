@@ -0,0 +1,6 @@
+import os
+from app.asgi import create_asgi_app
+
+# Get environment from ENV variable or default to development
+env = os.getenv('FLASK_ENV', 'development')
+application = create_asgi_app(env)
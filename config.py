@@ -4,16 +4,113 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _database_url(name):
+    url = os.getenv(name)
+    return url.replace("postgres://", "postgresql://") if url else None
+
+
+def engine_options(url, asyncpg=False):
+    """Connection pool and statement timeout settings for a PostgreSQL engine.
+    
+    Other backends (e.g. SQLite in development) keep their driver defaults.
+    Pass asyncpg=True for the async engine, which sets the timeout through
+    server settings instead of libpq options.
+    """
+    if not url or not url.startswith('postgresql'):
+        return {}
+    
+    options = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 5)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    }
+    
+    statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT', 10000))
+    if statement_timeout > 0 and asyncpg:
+        options['connect_args'] = {'server_settings': {'statement_timeout': str(statement_timeout)}}
+    elif statement_timeout > 0:
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    
+    return options
+
+
 class Config:
     """Base configuration."""
     
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-    SQLALCHEMY_DATABASE_URI = os.getenv('CROSSWORD_DATABASE_URL').replace("postgres://", "postgresql://") or 'invalid_db_uri'
+    # Falls back to SQLite (in the instance folder) for local work without Postgres
+    SQLALCHEMY_DATABASE_URI = _database_url('CROSSWORD_DATABASE_URL') or 'sqlite:///crossword.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Database Pool Configuration (DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+    # DB_POOL_RECYCLE, DB_POOL_PRE_PING; DB_STATEMENT_TIMEOUT in ms, 0 disables it)
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    
+    # Read Replica (public GET routes read from it when set; writes stay on the primary)
+    REPLICA_DATABASE_URL = _database_url('CROSSWORD_REPLICA_DATABASE_URL')
+    SQLALCHEMY_BINDS = {
+        'replica': dict(engine_options(REPLICA_DATABASE_URL), url=REPLICA_DATABASE_URL)
+    } if REPLICA_DATABASE_URL else {}
+    # Seconds after a write during which the topic's public cache misses read
+    # the primary, so replica lag can't put the old row back in the cache
+    REPLICA_WRITE_GRACE = int(os.getenv('REPLICA_WRITE_GRACE', 10))
+    
     # API Configuration
     API_KEY = os.getenv('API_KEY', 'your-api-key')
     
+    # JSON Configuration ('auto' uses orjson when installed, else stdlib json)
+    JSON_ENCODER = os.getenv('JSON_ENCODER', 'auto')
+    
+    # Puzzle Cache Configuration (per-process; the TTL bounds how long other
+    # workers can serve a puzzle after it was changed through this one)
+    PUZZLE_CACHE_SIZE = int(os.getenv('PUZZLE_CACHE_SIZE', 256))
+    PUZZLE_CACHE_TTL = int(os.getenv('PUZZLE_CACHE_TTL', 300))
+    
+    # Shared Puzzle Cache ('redis' adds a tier every worker on the host reads
+    # before the database; 'none' keeps the cache per-process only)
+    PUZZLE_CACHE_BACKEND = os.getenv('PUZZLE_CACHE_BACKEND', 'none')
+    PUZZLE_CACHE_REDIS_URL = os.getenv('PUZZLE_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    PUZZLE_CACHE_REDIS_PREFIX = os.getenv('PUZZLE_CACHE_REDIS_PREFIX', 'cloverkit:puzzles:')
+    PUZZLE_CACHE_REDIS_TIMEOUT = float(os.getenv('PUZZLE_CACHE_REDIS_TIMEOUT', 0.25))
+    
+    # Cache Warm-up (preload today's and tomorrow's puzzles at startup, then
+    # refresh them in a background thread; keep the interval below the TTL)
+    CACHE_WARMUP = os.getenv('CACHE_WARMUP', 'false').lower() == 'true'
+    CACHE_REFRESH_INTERVAL = int(os.getenv('CACHE_REFRESH_INTERVAL', 120))
+    
+    # Batch Endpoint Limits
+    BATCH_MAX_TOPICS = int(os.getenv('BATCH_MAX_TOPICS', 20))
+    BATCH_MAX_DAYS = int(os.getenv('BATCH_MAX_DAYS', 31))
+    
+    # Response Compression (bodies under COMPRESS_MIN_SIZE bytes are sent as-is)
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 500))
+    COMPRESS_GZIP_LEVEL = int(os.getenv('COMPRESS_GZIP_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv('COMPRESS_BROTLI_QUALITY', 6))
+    
+    # Bulk Import Configuration (rows per INSERT statement and transaction)
+    BULK_INSERT_BATCH_SIZE = int(os.getenv('BULK_INSERT_BATCH_SIZE', 500))
+    
+    # Async Read Path (asgi.py; reads the replica if set, else the primary,
+    # through asyncpg / aiosqlite unless ASYNC_DATABASE_URL overrides it)
+    ASYNC_DATABASE_URL = _database_url('ASYNC_DATABASE_URL')
+    
+    # Health Checks (seconds a readiness probe result is reused)
+    HEALTH_PROBE_INTERVAL = int(os.getenv('HEALTH_PROBE_INTERVAL', 5))
+    
+    # Metrics (GET /metrics in the Prometheus format; needs prometheus_client)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
+    
+    # Profiling (requests with an X-Profile header and a valid API key are run
+    # under cProfile; reports are returned, or stored in PROFILE_DIR if set)
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+    PROFILE_DIR = os.getenv('PROFILE_DIR')
+    PROFILE_REPORT_LINES = int(os.getenv('PROFILE_REPORT_LINES', 40))
+    
+    # Slow Query Log (statements slower than this are logged; 0 disables it)
+    SLOW_QUERY_THRESHOLD_MS = int(os.getenv('SLOW_QUERY_THRESHOLD_MS', 0))
+    
     # CORS Configuration
     ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', '*').split(',')
     
@@ -32,12 +129,16 @@ class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     FLASK_ENV = 'production'
+    CACHE_WARMUP = os.getenv('CACHE_WARMUP', 'true').lower() == 'true'
+    # No SQLite fallback in production; an unset URL fails at startup
+    SQLALCHEMY_DATABASE_URI = _database_url('CROSSWORD_DATABASE_URL')
 
 
 class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = os.getenv('CROSSWORD_DATABASE_URL').replace("postgres://", "postgresql://") or 'invalid_db_uri'
+    SQLALCHEMY_DATABASE_URI = _database_url('CROSSWORD_TEST_DATABASE_URL') or 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
 
 
 config = {
@@ -0,0 +1,146 @@
+"""
+Gunicorn production configuration.
+
+Usage: gunicorn -c gunicorn.conf.py "app:create_app('production')"
+       GUNICORN_WORKER_CLASS=uvicorn gunicorn -c gunicorn.conf.py asgi:application
+
+Every setting can be overridden from the environment:
+
+- GUNICORN_WORKER_CLASS - sync, gthread (default), gevent or uvicorn (for the ASGI app only)
+- WEB_CONCURRENCY / GUNICORN_WORKERS - Worker processes (default derived from the CPU count)
+- GUNICORN_THREADS - Threads per gthread worker (default 4)
+- GUNICORN_WORKER_CONNECTIONS - Concurrent requests per gevent worker (default 1000)
+- GUNICORN_PRELOAD - Import the app once in the master before forking (default true, false for gevent)
+- GUNICORN_KEEPALIVE - Seconds to hold idle keep-alive connections (default 5)
+- GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER - Recycle workers after this many requests (default 1000 / 100)
+- GUNICORN_TIMEOUT - Seconds before a silent worker is killed (default 30)
+- PROMETHEUS_MULTIPROC_DIR - Where workers write metric samples when METRICS_ENABLED
+  is true (default a fresh temporary directory per server start)
+"""
+
+import os
+import tempfile
+
+WORKER_CLASSES = ('sync', 'gthread', 'gevent', 'uvicorn')
+
+
+def _cpu_count():
+    try:
+        # Respects CPU affinity (e.g. container cpusets), unlike os.cpu_count()
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def _default_workers(worker_class, cpus):
+    # Sync workers block on every database round trip, so oversubscribe the
+    # CPUs; threaded and green workers get their concurrency within a process
+    if worker_class == 'sync':
+        return 2 * cpus + 1
+    return cpus + 1
+
+
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+if worker_class not in WORKER_CLASSES:
+    raise ValueError(f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}')
+
+bind = f'0.0.0.0:{os.getenv("PORT", 5000)}'
+
+workers = _env_int('GUNICORN_WORKERS', os.getenv('WEB_CONCURRENCY') or _default_workers(worker_class, _cpu_count()))
+threads = _env_int('GUNICORN_THREADS', 4) if worker_class == 'gthread' else 1
+worker_connections = _env_int('GUNICORN_WORKER_CONNECTIONS', 1000)
+
+# The ASGI app (asgi:application) runs its reads on uvicorn's event loop
+if worker_class == 'uvicorn':
+    worker_class = 'uvicorn.workers.UvicornWorker'
+
+# Importing the app after gevent has monkey-patched the worker keeps psycopg2
+# and the cache scheduler on green threads, so gevent defaults to no preload
+preload_app = os.getenv('GUNICORN_PRELOAD', str(worker_class != 'gevent')).lower() == 'true'
+
+# Keep-alive only applies to gthread and gevent; sync workers close every connection.
+# It must stay below the idle timeout of the load balancer in front.
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# Recycle workers to bound memory growth; the jitter staggers restarts
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+timeout = _env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = timeout
+
+# Heartbeat files on tmpfs, so a slow disk can't get workers killed
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# prometheus_client picks its multiprocess mode at import time, so the
+# directory must be set before the app is loaded
+metrics_enabled = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
+if metrics_enabled and 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='prometheus-')
+
+
+def _flask_app(app):
+    # Unwrap the ASGI app to reach the Flask app it serves
+    return getattr(app, 'flask_app', app)
+
+
+def _preloaded_app(server):
+    if not server.cfg.preload_app:
+        return None
+    return _flask_app(server.app.wsgi())
+
+
+def when_ready(server):
+    """Release what the preloaded app opened in the master before forking."""
+    app = _preloaded_app(server)
+    if app is None:
+        return
+
+    from app import db
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+    if metrics_enabled:
+        # The master serves no requests; keep its pool gauges out of the totals
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connections."""
+    if worker_class == 'gevent':
+        try:
+            from psycogreen.gevent import patch_psycopg
+            patch_psycopg()
+        except ImportError:
+            server.log.warning('psycogreen is not installed; psycopg2 will block gevent workers')
+
+    app = _preloaded_app(server)
+    if app is None:
+        return
+
+    from app import db
+    with app.app_context():
+        # Drop pooled connections inherited from the master without closing
+        # the sockets, which the master still owns
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    """Warm the cache and start its scheduler once the worker has loaded the app."""
+    from app.utils.warmup import start_cache_scheduler
+    start_cache_scheduler(_flask_app(worker.wsgi))
+
+
+def child_exit(server, worker):
+    """Drop an exited worker's live gauges from the aggregated metrics."""
+    if metrics_enabled:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,27 @@
+"""add puzzle payload
+
+Revision ID: 3b7d2a9f4c61
+Revises: 5e1c8d75827e
+Create Date: 2026-10-17 09:12:44.318201
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7d2a9f4c61'
+down_revision = '5e1c8d75827e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows are filled in by `flask puzzles backfill-payload`
+    with op.batch_alter_table('puzzles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('payload', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('puzzles', schema=None) as batch_op:
+        batch_op.drop_column('payload')
@@ -0,0 +1,39 @@
+"""add puzzle search text
+
+Revision ID: 8c4f1e2a7b93
+Revises: 3b7d2a9f4c61
+Create Date: 2026-10-17 21:35:10.527914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4f1e2a7b93'
+down_revision = '3b7d2a9f4c61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows are filled in by `flask puzzles backfill-payload`
+    with op.batch_alter_table('puzzles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_text', sa.Text(), nullable=True))
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build the GIN index without blocking writes to the archive
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_puzzles_search', 'puzzles',
+                [sa.text("to_tsvector('english', search_text)")],
+                postgresql_using='gin', postgresql_concurrently=True
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_puzzles_search', table_name='puzzles')
+
+    with op.batch_alter_table('puzzles', schema=None) as batch_op:
+        batch_op.drop_column('search_text')
@@ -1,6 +1,7 @@
 import os
 from app import create_app, db
 from app.models import Puzzle
+from app.utils.warmup import start_cache_scheduler
 
 # Get environment from ENV variable or default to development
 env = os.getenv('FLASK_ENV', 'development')
@@ -18,4 +19,5 @@ if __name__ == '__main__':
     host = app.config.get('HOST', '0.0.0.0')
     debug = app.config.get('DEBUG', True)
     
+    start_cache_scheduler(app)
     app.run(host=host, port=port, debug=debug)
@@ -0,0 +1,262 @@
+"""
+Offline API benchmark through the Flask test client.
+
+Seeds a database (an in-memory SQLite database by default, so no Postgres
+is needed) with --puzzles puzzles spread over --topics topics, then times
+the daily, date, list, get, create and update endpoints and prints
+throughput and latency percentiles for each.
+
+Save a run with --output and compare later runs against it with --baseline.
+The comparison fails (exit status 1) when a scenario's throughput drops, or
+its p95 latency rises, by more than --tolerance. Compare runs from the same
+machine only.
+
+Usage: python scripts/bench_api.py [--puzzles 5000] [--topics 20] [--requests 2000]
+       [--database-url sqlite://] [--no-cache] [--output bench.json]
+       [--baseline bench.json --tolerance 0.2]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+API_KEY = 'bench-api-key'
+HEADERS = {'X-API-Key': API_KEY}
+
+SCENARIOS = ('daily', 'date', 'list', 'get', 'create', 'update')
+
+
+def build_app(database_url, cache):
+    """Create a testing app on database_url with a fresh schema."""
+    os.environ['CROSSWORD_TEST_DATABASE_URL'] = database_url
+    os.environ['API_KEY'] = API_KEY
+    os.environ['CACHE_WARMUP'] = 'false'
+    if not cache:
+        os.environ['PUZZLE_CACHE_SIZE'] = '0'
+
+    from app import create_app, db
+
+    app = create_app('testing')
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    return app
+
+
+def seed(app, puzzles, topics, batch_size=1000):
+    """Insert puzzles spread over topics; return [(topic, publish_date, id)]."""
+    from app import db
+    from app.models import Puzzle
+    from seed_puzzles import SHOPPING_PUZZLE
+
+    template = {key: value for key, value in SHOPPING_PUZZLE.items() if key not in ('title', 'topic')}
+    per_topic = -(-puzzles // topics)
+    today = date.today()
+    seeded = []
+
+    with app.app_context():
+        rows = []
+        for index in range(puzzles):
+            topic = f'topic-{index % topics}'
+            publish_date = today - timedelta(days=index // topics)
+            puzzle = Puzzle(
+                title=f'Puzzle {index}',
+                topic=topic,
+                publish_date=publish_date,
+                is_active=True,
+                **template
+            )
+            rows.append(puzzle.to_row())
+            seeded.append((topic, publish_date, rows[-1]['id']))
+
+            if len(rows) == batch_size:
+                db.session.execute(Puzzle.__table__.insert(), rows)
+                rows = []
+
+        if rows:
+            db.session.execute(Puzzle.__table__.insert(), rows)
+        db.session.commit()
+
+    print(f'Seeded {puzzles} puzzles across {topics} topics ({per_topic} days each)\n')
+    return seeded
+
+
+def build_requests(seeded, topics, rng):
+    """Return {scenario: function issuing one request with the test client}."""
+    from seed_puzzles import SHOPPING_PUZZLE
+
+    new_dates = iter(range(1, 10 ** 9))
+    pages = max(len(seeded) // 20, 1)
+
+    def daily(client):
+        return client.get(f'/api/v1/puzzles/daily?topic=topic-{rng.randrange(topics)}')
+
+    def by_date(client):
+        topic, publish_date, _ = rng.choice(seeded)
+        return client.get(f'/api/v1/puzzles/date?topic={topic}&date={publish_date.isoformat()}')
+
+    def list_page(client):
+        return client.get(f'/api/v1/puzzles?page={rng.randrange(pages) + 1}&per_page=20', headers=HEADERS)
+
+    def get(client):
+        return client.get(f'/api/v1/puzzles/{rng.choice(seeded)[2]}', headers=HEADERS)
+
+    def create(client):
+        # Future dates on a separate topic never conflict with seeded rows
+        publish_date = date.today() + timedelta(days=next(new_dates))
+        return client.post('/api/v1/puzzles', json=dict(
+            SHOPPING_PUZZLE, topic='bench-create', publish_date=publish_date.isoformat()
+        ), headers=HEADERS)
+
+    def update(client):
+        return client.put(f'/api/v1/puzzles/{rng.choice(seeded)[2]}', json={
+            'title': f'Updated {uuid.uuid4().hex[:8]}'
+        }, headers=HEADERS)
+
+    return {
+        'daily': daily,
+        'date': by_date,
+        'list': list_page,
+        'get': get,
+        'create': create,
+        'update': update,
+    }
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def run_scenario(client, issue, requests, warmup):
+    """Issue requests one after another; return throughput and latency stats."""
+    for _ in range(warmup):
+        issue(client)
+
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+
+    for _ in range(requests):
+        request_started = time.perf_counter()
+        response = issue(client)
+        latencies.append(time.perf_counter() - request_started)
+        if response.status_code >= 400:
+            errors += 1
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    return {
+        'requests': requests,
+        'errors': errors,
+        'throughput': requests / elapsed,
+        'mean_ms': sum(latencies) / len(latencies) * 1000,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print the change against baseline; return the names of regressed scenarios."""
+    regressions = []
+
+    print(f'\n{"scenario":<10} {"req/s":>18} {"p95 ms":>18}')
+    for scenario, result in results.items():
+        previous = baseline.get('scenarios', {}).get(scenario)
+        if previous is None:
+            print(f'{scenario:<10} {"(not in baseline)":>18}')
+            continue
+
+        throughput_change = result['throughput'] / previous['throughput'] - 1
+        p95_change = result['p95_ms'] / previous['p95_ms'] - 1
+        regressed = throughput_change < -tolerance or p95_change > tolerance
+        if regressed:
+            regressions.append(scenario)
+
+        print(
+            f'{scenario:<10} {throughput_change:>+17.1%} {p95_change:>+17.1%}'
+            f'{"  REGRESSION" if regressed else ""}'
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default='sqlite://', help='Database to seed and query (it is dropped and recreated)')
+    parser.add_argument('--puzzles', type=int, default=5000, help='Puzzles to seed')
+    parser.add_argument('--topics', type=int, default=20, help='Topics to spread them over')
+    parser.add_argument('--requests', type=int, default=2000, help='Timed requests per scenario')
+    parser.add_argument('--warmup', type=int, default=100, help='Untimed requests per scenario first')
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS, help='Scenarios to run (default all)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the puzzle cache')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for request parameters')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--baseline', help='Compare against results saved with --output')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative regression (default 0.2)')
+    args = parser.parse_args()
+
+    app = build_app(args.database_url, cache=not args.no_cache)
+    seeded = seed(app, args.puzzles, args.topics)
+    issuers = build_requests(seeded, args.topics, random.Random(args.seed))
+    client = app.test_client()
+
+    results = {}
+    print(f'{"scenario":<10} {"req/s":>10} {"mean ms":>8} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"errors":>7}')
+
+    for scenario in args.scenario or SCENARIOS:
+        result = run_scenario(client, issuers[scenario], args.requests, args.warmup)
+        results[scenario] = result
+        print(
+            f'{scenario:<10} {result["throughput"]:>10,.0f} {result["mean_ms"]:>8.2f} {result["p50_ms"]:>8.2f} '
+            f'{result["p95_ms"]:>8.2f} {result["p99_ms"]:>8.2f} {result["errors"]:>7}'
+        )
+
+    options = {
+        'database': args.database_url.split(':', 1)[0],
+        'puzzles': args.puzzles,
+        'topics': args.topics,
+        'requests': args.requests,
+        'cache': not args.no_cache,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'created_at': datetime.utcnow().isoformat(),
+                'options': options,
+                'scenarios': results,
+            }, f, indent=2)
+        print(f'\nResults written to {args.output}')
+
+    errors = [scenario for scenario, result in results.items() if result['errors']]
+    if errors:
+        print(f'\nRequests failed in: {", ".join(errors)}')
+        sys.exit(1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        if baseline.get('options') != options:
+            print(f'\nWarning: baseline options {baseline.get("options")} differ from {options}')
+
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f'\nRegressed beyond {args.tolerance:.0%}: {", ".join(regressions)}')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Throughput benchmark for the gunicorn worker classes in gunicorn.conf.py.
+
+Starts gunicorn once per worker class against the configured database,
+drives a public endpoint with keep-alive client threads for a fixed time and
+prints requests per second and latency percentiles. Worker classes whose
+dependencies are missing (gevent) are skipped.
+
+The client runs in this process, so at high rates it can become the
+bottleneck; use wrk or hey against a manually started server to go further.
+
+Usage: python scripts/bench_gunicorn.py [--path /api/v1/puzzles/daily?topic=shopping]
+       [--worker-class sync --worker-class gthread] [--concurrency 32] [--duration 10]
+"""
+
+import argparse
+import http.client
+import importlib.util
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+WORKER_CLASSES = ('sync', 'gthread', 'gevent')
+
+
+def start_server(worker_class, port, app, extra_env):
+    """Start gunicorn with the production config and wait until it accepts connections."""
+    env = dict(os.environ, GUNICORN_WORKER_CLASS=worker_class, PORT=str(port), **extra_env)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', app],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'gunicorn ({worker_class}) exited with status {process.returncode}')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError(f'gunicorn ({worker_class}) did not start within 30 seconds')
+
+
+def run_load(port, path, concurrency, duration):
+    """Issue requests from concurrency keep-alive clients; return (latencies, errors, seconds)."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        local_latencies = []
+        local_errors = 0
+
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                connection.request('GET', path, headers={'Accept-Encoding': 'gzip'})
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 400:
+                    local_errors += 1
+                # Sync workers close the connection after every response
+                if response.will_close:
+                    connection.close()
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                continue
+            local_latencies.append(time.perf_counter() - started)
+
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return latencies, errors[0], time.monotonic() - started
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--app', default="app:create_app('production')", help='WSGI app to serve')
+    parser.add_argument('--path', default='/api/v1/puzzles/daily?topic=shopping', help='Request path')
+    parser.add_argument('--worker-class', action='append', choices=WORKER_CLASSES, help='Worker classes to compare (default all)')
+    parser.add_argument('--concurrency', type=int, default=32, help='Concurrent client connections')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds to drive each server')
+    parser.add_argument('--warmup', type=float, default=2, help='Seconds of unmeasured load first')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind gunicorn to')
+    parser.add_argument('--workers', type=int, help='Override the worker count')
+    args = parser.parse_args()
+
+    extra_env = {'GUNICORN_WORKERS': str(args.workers)} if args.workers else {}
+
+    print(f'{"worker class":<14} {"req/s":>10} {"p50 ms":>8} {"p90 ms":>8} {"p99 ms":>8} {"errors":>7}')
+
+    for worker_class in args.worker_class or WORKER_CLASSES:
+        if worker_class == 'gevent' and importlib.util.find_spec('gevent') is None:
+            print(f'{worker_class:<14} skipped (gevent is not installed)')
+            continue
+
+        process = start_server(worker_class, args.port, args.app, extra_env)
+        try:
+            run_load(args.port, args.path, args.concurrency, args.warmup)
+            latencies, errors, seconds = run_load(args.port, args.path, args.concurrency, args.duration)
+        finally:
+            process.terminate()
+            process.wait()
+
+        print(
+            f'{worker_class:<14} {len(latencies) / seconds:>10,.0f} '
+            f'{percentile(latencies, 0.5) * 1000:>8.2f} {percentile(latencies, 0.9) * 1000:>8.2f} '
+            f'{percentile(latencies, 0.99) * 1000:>8.2f} {errors:>7}'
+        )
+
+
+if __name__ == '__main__':
+    main()
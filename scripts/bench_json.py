@@ -0,0 +1,102 @@
+"""
+Micro-benchmark for the JSON providers, using the puzzles from seed_puzzles.py.
+
+Encodes each seeded puzzle's API representation (Puzzle.to_dict()) and the
+raw row values (UUID, date and datetime objects) with Flask's default
+provider and with FastJSONProvider in each available encoder mode.
+
+Usage: python scripts/bench_json.py [--iterations 20000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import uuid
+from datetime import date, datetime
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from app.models import Puzzle
+from app.utils.json_provider import FastJSONProvider, orjson
+from seed_puzzles import SHOPPING_PUZZLE, CARS_PUZZLE, MUSIC_PUZZLE
+
+
+def build_samples():
+    """Return (name, object) pairs to encode for every seeded puzzle."""
+    samples = []
+    now = datetime.utcnow()
+
+    for seed in (SHOPPING_PUZZLE, CARS_PUZZLE, MUSIC_PUZZLE):
+        puzzle = Puzzle(
+            id=uuid.uuid4(),
+            publish_date=date.today(),
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+            **seed
+        )
+        row = {column.name: getattr(puzzle, column.name) for column in Puzzle.__table__.columns}
+        row.pop('payload', None)
+
+        samples.append((f'{seed["topic"]} to_dict', puzzle.to_dict()))
+        samples.append((f'{seed["topic"]} raw row', row))
+
+    return samples
+
+
+def build_providers():
+    """Return (name, encode function) pairs for each provider to compare."""
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    providers = [('flask default', lambda obj: default_provider.dumps(obj, default=_row_default))]
+
+    for encoder in ('stdlib', 'orjson'):
+        if encoder == 'orjson' and orjson is None:
+            print('orjson is not installed; skipping the orjson provider\n')
+            continue
+
+        app = Flask(__name__)
+        app.config['JSON_ENCODER'] = encoder
+        provider = FastJSONProvider(app)
+        providers.append((f'fast ({encoder})', provider.dumps_bytes))
+
+    return providers
+
+
+def _row_default(obj):
+    # Flask's default encoder writes dates as HTTP dates; use ISO for a fair comparison
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20000, help='Encodes per sample and provider')
+    args = parser.parse_args()
+
+    samples = build_samples()
+    providers = build_providers()
+
+    print(f'{"sample":<20} {"provider":<16} {"bytes":>7} {"encodes/s":>12} {"speedup":>8}')
+
+    for sample_name, obj in samples:
+        baseline = None
+
+        for provider_name, encode in providers:
+            size = len(encode(obj))
+            seconds = timeit.timeit(lambda: encode(obj), number=args.iterations)
+            rate = args.iterations / seconds
+            baseline = baseline or rate
+
+            print(f'{sample_name:<20} {provider_name:<16} {size:>7} {rate:>12,.0f} {rate / baseline:>7.1f}x')
+
+        print()
+
+
+if __name__ == '__main__':
+    main()
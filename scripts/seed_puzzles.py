@@ -1,396 +1,311 @@
 """
-Seed script to populate the database with initial crossword puzzles.
+Seed script to populate the database with the sample crossword puzzles.
 Run this script after creating the database and running migrations.
 
-Usage: python scripts/seed_puzzles.py
+Writes each topic's sample puzzle for every day from --start to --end
+(today and tomorrow by default) with batched INSERT ... ON CONFLICT
+(topic, publish_date) statements in a single transaction. Days that already
+have a puzzle for the topic are skipped, or overwritten with --update, so
+the script is safe to re-run. For distinct puzzles per day, use
+`flask puzzles generate`.
+
+Usage: python scripts/seed_puzzles.py [--topics shopping,cars,music]
+       [--start 2026-01-01] [--end 2026-12-31 | --days 365] [--update]
+       [--config development] [--batch-size 500]
 """
 
+import argparse
 import sys
 import os
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import create_app, db
+from app import create_app, db, puzzle_cache
 from app.models import Puzzle
 
 
-def seed_shopping_puzzle():
-    """Seed the shopping-themed crossword puzzle."""
-    
-    # Check if shopping puzzle already exists for today
-    existing_today = Puzzle.query.filter_by(
-        topic='shopping',
-        publish_date=date.today()
-    ).first()
-    
-    if existing_today:
-        print(f"⏭️  Skipped: Shopping puzzle for {date.today()} already exists")
-    else:
-        # This is the puzzle from the frontend JavaScript
-        puzzle_data_today = {
-        'title': 'Shopping Crossword',
-        'topic': 'shopping',
-        'difficulty': 'medium',
-        'grid_size': 10,
-        'grid_data': [
-            ['S', 'H', 'O', 'P', 'I', 'F', 'Y', None, 'C', 'A', 'R', 'T'],
-            ['H', None, 'R', None, 'T', None, None, None, 'A', None, 'D', None],
-            ['O', None, 'D', None, 'E', None, 'O', 'R', 'D', 'E', 'R', 'S'],
-            ['P', 'R', 'O', 'D', 'U', 'C', 'T', None, 'A', None, 'E', None],
-            [None, None, None, None, None, None, None, None, 'D', None, 'T', None],
-            ['S', 'A', 'L', 'E', 'S', None, 'P', 'R', 'I', 'C', 'Y', None],
-            ['A', None, None, None, 'L', None, 'T', None, 'C', None, None, None],
-            ['L', None, None, None, 'L', None, 'O', None, 'K', None, None, None],
-            ['E', None, None, None, 'S', None, 'R', None, 'O', None, None, None],
-            [None, None, 'C', 'H', 'E', 'C', 'K', 'O', 'U', 'T', 'S', None]
-        ],
-        'across_clues': {
-            '1': 'E-commerce platform',
-            '8': 'Shopping basket',
-            '10': 'Purchase request',
-            '11': 'Item for sale',
-            '13': 'Discounted items',
-            '15': 'Expensive',
-            '18': 'Final purchase step'
-        },
-        'down_clues': {
-            '1': 'Online store',
-            '2': 'Buyer',
-            '3': 'Transaction',
-            '4': 'Platform',
-            '5': 'Goods',
-            '6': 'Design',
-            '7': 'Vendor',
-            '9': 'Add to',
-            '12': 'Price tag',
-            '14': 'Store section'
-        },
-        'clue_positions': {
-            '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 7},
-            '2': {'row': 1, 'col': 0, 'direction': 'down', 'length': 4},
-            '3': {'row': 2, 'col': 2, 'direction': 'down', 'length': 3},
-            '4': {'row': 3, 'col': 0, 'direction': 'down', 'length': 4},
-            '5': {'row': 0, 'col': 4, 'direction': 'down', 'length': 9},
-            '6': {'row': 4, 'col': 2, 'direction': 'down', 'length': 3},
-            '7': {'row': 5, 'col': 0, 'direction': 'down', 'length': 4},
-            '8': {'row': 0, 'col': 8, 'direction': 'across', 'length': 4},
-            '9': {'row': 1, 'col': 8, 'direction': 'down', 'length': 9},
-            '10': {'row': 2, 'col': 6, 'direction': 'across', 'length': 6},
-            '11': {'row': 3, 'col': 0, 'direction': 'across', 'length': 7},
-            '12': {'row': 3, 'col': 10, 'direction': 'down', 'length': 5},
-            '13': {'row': 5, 'col': 0, 'direction': 'across', 'length': 5},
-            '14': {'row': 6, 'col': 6, 'direction': 'down', 'length': 3},
-            '15': {'row': 5, 'col': 6, 'direction': 'across', 'length': 5},
-            '18': {'row': 9, 'col': 2, 'direction': 'across', 'length': 8}
-        },
-            'publish_date': date.today(),
-            'is_active': True
-        }
-        
-        puzzle = Puzzle(**puzzle_data_today)
-        db.session.add(puzzle)
-        print(f"✓ Created puzzle: {puzzle.title} for {puzzle.publish_date}")
-    
-    # Check if shopping puzzle already exists for tomorrow
-    existing_tomorrow = Puzzle.query.filter_by(
-        topic='shopping',
-        publish_date=date.today() + timedelta(days=1)
-    ).first()
-    
-    if existing_tomorrow:
-        print(f"⏭️  Skipped: Shopping puzzle for {date.today() + timedelta(days=1)} already exists")
-    else:
-        # Create the same puzzle for tomorrow (for testing)
-        puzzle_data_tomorrow = {
-            'title': 'Shopping Crossword',
-            'topic': 'shopping',
-            'difficulty': 'medium',
-            'grid_size': 10,
-            'grid_data': puzzle_data_today['grid_data'] if not existing_today else None,
-            'across_clues': puzzle_data_today['across_clues'] if not existing_today else {},
-            'down_clues': puzzle_data_today['down_clues'] if not existing_today else {},
-            'clue_positions': puzzle_data_today['clue_positions'] if not existing_today else {},
-            'publish_date': date.today() + timedelta(days=1),
-            'is_active': True
-        }
-        
-        # If today's puzzle was skipped, we need to define the data
-        if existing_today:
-            puzzle_data_tomorrow.update({
-                'grid_data': existing_today.grid_data,
-                'across_clues': existing_today.across_clues,
-                'down_clues': existing_today.down_clues,
-                'clue_positions': existing_today.clue_positions
-            })
-        
-        tomorrow_puzzle = Puzzle(**puzzle_data_tomorrow)
-        db.session.add(tomorrow_puzzle)
-        print(f"✓ Created puzzle: {tomorrow_puzzle.title} for {tomorrow_puzzle.publish_date}")
+# This is the puzzle from the frontend JavaScript
+SHOPPING_PUZZLE = {
+    'title': 'Shopping Crossword',
+    'topic': 'shopping',
+    'difficulty': 'medium',
+    'grid_size': 10,
+    'grid_data': [
+        ['S', 'H', 'O', 'P', 'I', 'F', 'Y', None, 'C', 'A', 'R', 'T'],
+        ['H', None, 'R', None, 'T', None, None, None, 'A', None, 'D', None],
+        ['O', None, 'D', None, 'E', None, 'O', 'R', 'D', 'E', 'R', 'S'],
+        ['P', 'R', 'O', 'D', 'U', 'C', 'T', None, 'A', None, 'E', None],
+        [None, None, None, None, None, None, None, None, 'D', None, 'T', None],
+        ['S', 'A', 'L', 'E', 'S', None, 'P', 'R', 'I', 'C', 'Y', None],
+        ['A', None, None, None, 'L', None, 'T', None, 'C', None, None, None],
+        ['L', None, None, None, 'L', None, 'O', None, 'K', None, None, None],
+        ['E', None, None, None, 'S', None, 'R', None, 'O', None, None, None],
+        [None, None, 'C', 'H', 'E', 'C', 'K', 'O', 'U', 'T', 'S', None]
+    ],
+    'across_clues': {
+        '1': 'E-commerce platform',
+        '8': 'Shopping basket',
+        '10': 'Purchase request',
+        '11': 'Item for sale',
+        '13': 'Discounted items',
+        '15': 'Expensive',
+        '18': 'Final purchase step'
+    },
+    'down_clues': {
+        '1': 'Online store',
+        '2': 'Buyer',
+        '3': 'Transaction',
+        '4': 'Platform',
+        '5': 'Goods',
+        '6': 'Design',
+        '7': 'Vendor',
+        '9': 'Add to',
+        '12': 'Price tag',
+        '14': 'Store section'
+    },
+    'clue_positions': {
+        '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 7},
+        '2': {'row': 1, 'col': 0, 'direction': 'down', 'length': 4},
+        '3': {'row': 2, 'col': 2, 'direction': 'down', 'length': 3},
+        '4': {'row': 3, 'col': 0, 'direction': 'down', 'length': 4},
+        '5': {'row': 0, 'col': 4, 'direction': 'down', 'length': 9},
+        '6': {'row': 4, 'col': 2, 'direction': 'down', 'length': 3},
+        '7': {'row': 5, 'col': 0, 'direction': 'down', 'length': 4},
+        '8': {'row': 0, 'col': 8, 'direction': 'across', 'length': 4},
+        '9': {'row': 1, 'col': 8, 'direction': 'down', 'length': 9},
+        '10': {'row': 2, 'col': 6, 'direction': 'across', 'length': 6},
+        '11': {'row': 3, 'col': 0, 'direction': 'across', 'length': 7},
+        '12': {'row': 3, 'col': 10, 'direction': 'down', 'length': 5},
+        '13': {'row': 5, 'col': 0, 'direction': 'across', 'length': 5},
+        '14': {'row': 6, 'col': 6, 'direction': 'down', 'length': 3},
+        '15': {'row': 5, 'col': 6, 'direction': 'across', 'length': 5},
+        '18': {'row': 9, 'col': 2, 'direction': 'across', 'length': 8}
+    }
+}
 
 
-def seed_cars_puzzle():
-    """Seed the cars-themed crossword puzzle."""
-    
-    # Check if cars puzzle already exists for today
-    existing_today = Puzzle.query.filter_by(
-        topic='cars',
-        publish_date=date.today()
-    ).first()
-    
-    if existing_today:
-        print(f"⏭️  Skipped: Cars puzzle for {date.today()} already exists")
-    else:
-        puzzle_data = {
-        'title': 'Cars Crossword',
-        'topic': 'cars',
-        'difficulty': 'medium',
-        'grid_size': 10,
-        'grid_data': [
-            ['E', 'N', 'G', 'I', 'N', 'E', None, 'S', 'E', 'D', 'A', 'N'],
-            ['R', None, 'A', None, None, None, None, 'P', None, None, 'I', None],
-            ['A', None, 'R', None, 'B', 'R', 'A', 'K', 'E', None, 'R', None],
-            ['C', 'L', 'U', 'T', 'C', 'H', None, 'E', None, None, 'E', None],
-            ['E', None, 'G', None, None, None, None, 'E', None, None, None, None],
-            [None, None, 'E', None, 'W', 'H', 'E', 'E', 'L', 'S', None, None],
-            ['M', 'O', 'T', 'O', 'R', None, None, 'D', None, None, 'T', 'I', 'R', 'E'],
-            ['I', None, None, None, None, None, None, None, None, None, 'R', None],
-            ['R', None, 'S', 'H', 'I', 'F', 'T', None, 'D', 'R', 'I', 'V', 'E'],
-            ['R', None, None, None, None, None, None, None, None, None, 'P', None],
-        ],
-        'across_clues': {
-            '1': 'Power source',
-            '7': 'Four-door car',
-            '9': 'Slow down device',
-            '10': 'Manual transmission pedal',
-            '13': 'Round rolling parts',
-            '15': 'Engine synonym',
-            '18': 'Change gears',
-            '19': 'Operate a vehicle',
-            '21': 'Rubber wheel cover'
-        },
-        'down_clues': {
-            '1': 'Competitive driving',
-            '2': 'Auto',
-            '3': 'Car storage',
-            '4': 'Parking lot',
-            '5': 'Need air',
-            '8': 'Fast',
-            '11': 'Dripping fluid',
-            '12': 'Long journey',
-            '16': 'Overhead light',
-            '17': 'Honk',
-            '20': 'Journey'
-        },
-        'clue_positions': {
-            '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 6},
-            '2': {'row': 0, 'col': 0, 'direction': 'down', 'length': 5},
-            '3': {'row': 0, 'col': 2, 'direction': 'down', 'length': 5},
-            '4': {'row': 3, 'col': 0, 'direction': 'down', 'length': 4},
-            '5': {'row': 0, 'col': 10, 'direction': 'down', 'length': 5},
-            '7': {'row': 0, 'col': 7, 'direction': 'across', 'length': 5},
-            '8': {'row': 0, 'col': 7, 'direction': 'down', 'length': 6},
-            '9': {'row': 2, 'col': 4, 'direction': 'across', 'length': 5},
-            '10': {'row': 3, 'col': 1, 'direction': 'across', 'length': 6},
-            '11': {'row': 2, 'col': 10, 'direction': 'down', 'length': 3},
-            '12': {'row': 6, 'col': 10, 'direction': 'down', 'length': 4},
-            '13': {'row': 5, 'col': 4, 'direction': 'across', 'length': 6},
-            '15': {'row': 6, 'col': 0, 'direction': 'across', 'length': 5},
-            '16': {'row': 6, 'col': 0, 'direction': 'down', 'length': 4},
-            '18': {'row': 8, 'col': 2, 'direction': 'across', 'length': 5},
-            '19': {'row': 8, 'col': 8, 'direction': 'across', 'length': 5},
-            '21': {'row': 6, 'col': 11, 'direction': 'across', 'length': 4}
-        },
-            'publish_date': date.today(),
-            'is_active': True
-        }
-        
-        puzzle = Puzzle(**puzzle_data)
-        db.session.add(puzzle)
-        print(f"✓ Created puzzle: {puzzle.title} for {puzzle.publish_date}")
-    
-    # Check if cars puzzle already exists for tomorrow
-    existing_tomorrow = Puzzle.query.filter_by(
-        topic='cars',
-        publish_date=date.today() + timedelta(days=1)
-    ).first()
-    
-    if existing_tomorrow:
-        print(f"⏭️  Skipped: Cars puzzle for {date.today() + timedelta(days=1)} already exists")
-    else:
-        # Create the same puzzle for tomorrow (for testing)
-        tomorrow_data = puzzle_data if not existing_today else {
-            'title': existing_today.title,
-            'topic': existing_today.topic,
-            'difficulty': existing_today.difficulty,
-            'grid_size': existing_today.grid_size,
-            'grid_data': existing_today.grid_data,
-            'across_clues': existing_today.across_clues,
-            'down_clues': existing_today.down_clues,
-            'clue_positions': existing_today.clue_positions,
-        }
-        
-        tomorrow_puzzle = Puzzle(
-            title=tomorrow_data['title'] if not existing_today else existing_today.title,
-            topic=tomorrow_data['topic'] if not existing_today else existing_today.topic,
-            difficulty=tomorrow_data['difficulty'] if not existing_today else existing_today.difficulty,
-            grid_size=tomorrow_data['grid_size'] if not existing_today else existing_today.grid_size,
-            grid_data=tomorrow_data['grid_data'] if not existing_today else existing_today.grid_data,
-            across_clues=tomorrow_data['across_clues'] if not existing_today else existing_today.across_clues,
-            down_clues=tomorrow_data['down_clues'] if not existing_today else existing_today.down_clues,
-            clue_positions=tomorrow_data['clue_positions'] if not existing_today else existing_today.clue_positions,
-            publish_date=date.today() + timedelta(days=1),
-            is_active=True
-        )
-        db.session.add(tomorrow_puzzle)
-        print(f"✓ Created puzzle: {tomorrow_puzzle.title} for {tomorrow_puzzle.publish_date}")
+CARS_PUZZLE = {
+    'title': 'Cars Crossword',
+    'topic': 'cars',
+    'difficulty': 'medium',
+    'grid_size': 10,
+    'grid_data': [
+        ['E', 'N', 'G', 'I', 'N', 'E', None, 'S', 'E', 'D', 'A', 'N'],
+        ['R', None, 'A', None, None, None, None, 'P', None, None, 'I', None],
+        ['A', None, 'R', None, 'B', 'R', 'A', 'K', 'E', None, 'R', None],
+        ['C', 'L', 'U', 'T', 'C', 'H', None, 'E', None, None, 'E', None],
+        ['E', None, 'G', None, None, None, None, 'E', None, None, None, None],
+        [None, None, 'E', None, 'W', 'H', 'E', 'E', 'L', 'S', None, None],
+        ['M', 'O', 'T', 'O', 'R', None, None, 'D', None, None, 'T', 'I', 'R', 'E'],
+        ['I', None, None, None, None, None, None, None, None, None, 'R', None],
+        ['R', None, 'S', 'H', 'I', 'F', 'T', None, 'D', 'R', 'I', 'V', 'E'],
+        ['R', None, None, None, None, None, None, None, None, None, 'P', None],
+    ],
+    'across_clues': {
+        '1': 'Power source',
+        '7': 'Four-door car',
+        '9': 'Slow down device',
+        '10': 'Manual transmission pedal',
+        '13': 'Round rolling parts',
+        '15': 'Engine synonym',
+        '18': 'Change gears',
+        '19': 'Operate a vehicle',
+        '21': 'Rubber wheel cover'
+    },
+    'down_clues': {
+        '1': 'Competitive driving',
+        '2': 'Auto',
+        '3': 'Car storage',
+        '4': 'Parking lot',
+        '5': 'Need air',
+        '8': 'Fast',
+        '11': 'Dripping fluid',
+        '12': 'Long journey',
+        '16': 'Overhead light',
+        '17': 'Honk',
+        '20': 'Journey'
+    },
+    'clue_positions': {
+        '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 6},
+        '2': {'row': 0, 'col': 0, 'direction': 'down', 'length': 5},
+        '3': {'row': 0, 'col': 2, 'direction': 'down', 'length': 5},
+        '4': {'row': 3, 'col': 0, 'direction': 'down', 'length': 4},
+        '5': {'row': 0, 'col': 10, 'direction': 'down', 'length': 5},
+        '7': {'row': 0, 'col': 7, 'direction': 'across', 'length': 5},
+        '8': {'row': 0, 'col': 7, 'direction': 'down', 'length': 6},
+        '9': {'row': 2, 'col': 4, 'direction': 'across', 'length': 5},
+        '10': {'row': 3, 'col': 1, 'direction': 'across', 'length': 6},
+        '11': {'row': 2, 'col': 10, 'direction': 'down', 'length': 3},
+        '12': {'row': 6, 'col': 10, 'direction': 'down', 'length': 4},
+        '13': {'row': 5, 'col': 4, 'direction': 'across', 'length': 6},
+        '15': {'row': 6, 'col': 0, 'direction': 'across', 'length': 5},
+        '16': {'row': 6, 'col': 0, 'direction': 'down', 'length': 4},
+        '18': {'row': 8, 'col': 2, 'direction': 'across', 'length': 5},
+        '19': {'row': 8, 'col': 8, 'direction': 'across', 'length': 5},
+        '21': {'row': 6, 'col': 11, 'direction': 'across', 'length': 4}
+    }
+}
 
 
-def seed_music_puzzle():
-    """Seed the music-themed crossword puzzle."""
+MUSIC_PUZZLE = {
+    'title': 'Music Crossword',
+    'topic': 'music',
+    'difficulty': 'medium',
+    'grid_size': 10,
+    'grid_data': [
+        ['G', 'U', 'I', 'T', 'A', 'R', None, 'P', 'I', 'A', 'N', 'O'],
+        ['E', None, None, None, None, None, None, 'L', None, None, 'O', None],
+        ['N', None, 'M', 'E', 'L', 'O', 'D', 'Y', None, None, 'T', None],
+        ['R', None, None, None, None, None, None, 'A', None, None, 'E', None],
+        ['E', None, 'D', 'R', 'U', 'M', 'S', None, None, None, 'S', None],
+        [None, None, None, None, None, None, None, None, None, None, None, None],
+        ['C', 'H', 'O', 'R', 'D', None, 'R', 'H', 'Y', 'T', 'H', 'M'],
+        ['O', None, None, None, None, None, 'E', None, None, None, None, None],
+        ['N', None, 'T', 'E', 'M', 'P', 'O', None, 'B', 'E', 'A', 'T', 'S'],
+        ['G', None, None, None, None, None, 'R', None, None, None, None, None],
+    ],
+    'across_clues': {
+        '1': 'Six-string instrument',
+        '7': 'Keyboard instrument',
+        '9': 'Tune',
+        '11': 'Percussion instruments',
+        '15': 'Three or more notes',
+        '16': 'Musical pattern',
+        '18': 'Speed of music',
+        '19': 'Pulse of music'
+    },
+    'down_clues': {
+        '1': 'Music style',
+        '2': 'Performance',
+        '3': 'Musical symbol',
+        '4': 'Music book',
+        '5': 'Vocal music',
+        '6': 'Written music',
+        '8': 'Singer group',
+        '10': 'Sound quality',
+        '12': 'Live show',
+        '13': 'Musical collection',
+        '14': 'Recorded music',
+        '17': 'Tape recorder'
+    },
+    'clue_positions': {
+        '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 6},
+        '2': {'row': 0, 'col': 0, 'direction': 'down', 'length': 5},
+        '3': {'row': 2, 'col': 2, 'direction': 'down', 'length': 3},
+        '4': {'row': 4, 'col': 2, 'direction': 'down', 'length': 3},
+        '5': {'row': 0, 'col': 10, 'direction': 'down', 'length': 5},
+        '6': {'row': 6, 'col': 6, 'direction': 'down', 'length': 4},
+        '7': {'row': 0, 'col': 7, 'direction': 'across', 'length': 5},
+        '8': {'row': 0, 'col': 7, 'direction': 'down', 'length': 4},
+        '9': {'row': 2, 'col': 2, 'direction': 'across', 'length': 6},
+        '10': {'row': 6, 'col': 0, 'direction': 'down', 'length': 4},
+        '11': {'row': 4, 'col': 2, 'direction': 'across', 'length': 5},
+        '12': {'row': 6, 'col': 10, 'direction': 'down', 'length': 2},
+        '15': {'row': 6, 'col': 0, 'direction': 'across', 'length': 5},
+        '16': {'row': 6, 'col': 6, 'direction': 'across', 'length': 6},
+        '18': {'row': 8, 'col': 2, 'direction': 'across', 'length': 5},
+        '19': {'row': 8, 'col': 8, 'direction': 'across', 'length': 5}
+    }
+}
+
+
+SAMPLE_PUZZLES = {
+    'shopping': SHOPPING_PUZZLE,
+    'cars': CARS_PUZZLE,
+    'music': MUSIC_PUZZLE,
+}
+
+
+def seed(topics, start_date, end_date, update=False, batch_size=500):
+    """Write the sample puzzle of each topic for every day in the range.
     
-    # Check if music puzzle already exists for today
-    existing_today = Puzzle.query.filter_by(
-        topic='music',
-        publish_date=date.today()
-    ).first()
+    Rows are sent batch_size at a time and committed together at the end.
+    Returns {'inserted', 'updated', 'skipped'} counts.
+    """
+    counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
+    rows = []
     
-    if existing_today:
-        print(f"⏭️  Skipped: Music puzzle for {date.today()} already exists")
-    else:
-        puzzle_data = {
-        'title': 'Music Crossword',
-        'topic': 'music',
-        'difficulty': 'medium',
-        'grid_size': 10,
-        'grid_data': [
-            ['G', 'U', 'I', 'T', 'A', 'R', None, 'P', 'I', 'A', 'N', 'O'],
-            ['E', None, None, None, None, None, None, 'L', None, None, 'O', None],
-            ['N', None, 'M', 'E', 'L', 'O', 'D', 'Y', None, None, 'T', None],
-            ['R', None, None, None, None, None, None, 'A', None, None, 'E', None],
-            ['E', None, 'D', 'R', 'U', 'M', 'S', None, None, None, 'S', None],
-            [None, None, None, None, None, None, None, None, None, None, None, None],
-            ['C', 'H', 'O', 'R', 'D', None, 'R', 'H', 'Y', 'T', 'H', 'M'],
-            ['O', None, None, None, None, None, 'E', None, None, None, None, None],
-            ['N', None, 'T', 'E', 'M', 'P', 'O', None, 'B', 'E', 'A', 'T', 'S'],
-            ['G', None, None, None, None, None, 'R', None, None, None, None, None],
-        ],
-        'across_clues': {
-            '1': 'Six-string instrument',
-            '7': 'Keyboard instrument',
-            '9': 'Tune',
-            '11': 'Percussion instruments',
-            '15': 'Three or more notes',
-            '16': 'Musical pattern',
-            '18': 'Speed of music',
-            '19': 'Pulse of music'
-        },
-        'down_clues': {
-            '1': 'Music style',
-            '2': 'Performance',
-            '3': 'Musical symbol',
-            '4': 'Music book',
-            '5': 'Vocal music',
-            '6': 'Written music',
-            '8': 'Singer group',
-            '10': 'Sound quality',
-            '12': 'Live show',
-            '13': 'Musical collection',
-            '14': 'Recorded music',
-            '17': 'Tape recorder'
-        },
-        'clue_positions': {
-            '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 6},
-            '2': {'row': 0, 'col': 0, 'direction': 'down', 'length': 5},
-            '3': {'row': 2, 'col': 2, 'direction': 'down', 'length': 3},
-            '4': {'row': 4, 'col': 2, 'direction': 'down', 'length': 3},
-            '5': {'row': 0, 'col': 10, 'direction': 'down', 'length': 5},
-            '6': {'row': 6, 'col': 6, 'direction': 'down', 'length': 4},
-            '7': {'row': 0, 'col': 7, 'direction': 'across', 'length': 5},
-            '8': {'row': 0, 'col': 7, 'direction': 'down', 'length': 4},
-            '9': {'row': 2, 'col': 2, 'direction': 'across', 'length': 6},
-            '10': {'row': 6, 'col': 0, 'direction': 'down', 'length': 4},
-            '11': {'row': 4, 'col': 2, 'direction': 'across', 'length': 5},
-            '12': {'row': 6, 'col': 10, 'direction': 'down', 'length': 2},
-            '15': {'row': 6, 'col': 0, 'direction': 'across', 'length': 5},
-            '16': {'row': 6, 'col': 6, 'direction': 'across', 'length': 6},
-            '18': {'row': 8, 'col': 2, 'direction': 'across', 'length': 5},
-            '19': {'row': 8, 'col': 8, 'direction': 'across', 'length': 5}
-        },
-            'publish_date': date.today(),
-            'is_active': True
-        }
+    def flush():
+        if update:
+            inserted_ids, updated = Puzzle.upsert_rows(rows)
+        else:
+            inserted_ids, updated = Puzzle.insert_rows(rows), []
         
-        puzzle = Puzzle(**puzzle_data)
-        db.session.add(puzzle)
-        print(f"✓ Created puzzle: {puzzle.title} for {puzzle.publish_date}")
+        counts['inserted'] += len(inserted_ids)
+        counts['updated'] += len(updated)
+        counts['skipped'] += len(rows) - len(inserted_ids) - len(updated)
+        rows.clear()
     
-    # Check if music puzzle already exists for tomorrow
-    existing_tomorrow = Puzzle.query.filter_by(
-        topic='music',
-        publish_date=date.today() + timedelta(days=1)
-    ).first()
-    
-    if existing_tomorrow:
-        print(f"⏭️  Skipped: Music puzzle for {date.today() + timedelta(days=1)} already exists")
-    else:
-        # Create the same puzzle for tomorrow (for testing)
-        tomorrow_data = puzzle_data if not existing_today else {
-            'title': existing_today.title,
-            'topic': existing_today.topic,
-            'difficulty': existing_today.difficulty,
-            'grid_size': existing_today.grid_size,
-            'grid_data': existing_today.grid_data,
-            'across_clues': existing_today.across_clues,
-            'down_clues': existing_today.down_clues,
-            'clue_positions': existing_today.clue_positions,
-        }
+    try:
+        for offset in range((end_date - start_date).days + 1):
+            publish_date = start_date + timedelta(days=offset)
+            for topic in topics:
+                rows.append(Puzzle(**SAMPLE_PUZZLES[topic], publish_date=publish_date, is_active=True).to_row())
+                
+                if len(rows) >= batch_size:
+                    flush()
+        
+        if rows:
+            flush()
         
-        tomorrow_puzzle = Puzzle(
-            title=tomorrow_data['title'] if not existing_today else existing_today.title,
-            topic=tomorrow_data['topic'] if not existing_today else existing_today.topic,
-            difficulty=tomorrow_data['difficulty'] if not existing_today else existing_today.difficulty,
-            grid_size=tomorrow_data['grid_size'] if not existing_today else existing_today.grid_size,
-            grid_data=tomorrow_data['grid_data'] if not existing_today else existing_today.grid_data,
-            across_clues=tomorrow_data['across_clues'] if not existing_today else existing_today.across_clues,
-            down_clues=tomorrow_data['down_clues'] if not existing_today else existing_today.down_clues,
-            clue_positions=tomorrow_data['clue_positions'] if not existing_today else existing_today.clue_positions,
-            publish_date=date.today() + timedelta(days=1),
-            is_active=True
-        )
-        db.session.add(tomorrow_puzzle)
-        print(f"✓ Created puzzle: {tomorrow_puzzle.title} for {tomorrow_puzzle.publish_date}")
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    
+    puzzle_cache.invalidate_topic(*topics)
+    return counts
+
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Invalid date {value!r}, use YYYY-MM-DD')
 
 
 def main():
     """Main seeding function."""
-    app = create_app('development')
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--topics', default=','.join(SAMPLE_PUZZLES),
+                        help=f'Comma-separated topics (default {",".join(SAMPLE_PUZZLES)})')
+    parser.add_argument('--start', type=_parse_date, default=date.today(), help='First publish date (default today)')
+    parser.add_argument('--end', type=_parse_date, help='Last publish date (default the day after --start)')
+    parser.add_argument('--days', type=int, help='Number of days to seed, instead of --end')
+    parser.add_argument('--update', action='store_true', help='Overwrite existing puzzles instead of skipping them')
+    parser.add_argument('--config', default=os.getenv('FLASK_ENV', 'development'), help='App configuration to use')
+    parser.add_argument('--batch-size', type=int, help='Rows per INSERT (default BULK_INSERT_BATCH_SIZE)')
+    args = parser.parse_args()
+    
+    topics = list(dict.fromkeys(topic.strip() for topic in args.topics.split(',') if topic.strip()))
+    unknown_topics = [topic for topic in topics if topic not in SAMPLE_PUZZLES]
+    if not topics or unknown_topics:
+        parser.error(f'Unknown topics: {", ".join(unknown_topics)}. Choose from {", ".join(SAMPLE_PUZZLES)}')
+    
+    if args.end and args.days:
+        parser.error('Pass either --end or --days, not both')
+    end_date = args.end or args.start + timedelta(days=(args.days or 2) - 1)
+    if end_date < args.start:
+        parser.error('--end must not be before --start')
+    
+    app = create_app(args.config)
     
     with app.app_context():
-        print("Starting database seeding...")
-        
-        # Check if puzzles already exist
-        existing_count = Puzzle.query.count()
-        if existing_count > 0:
-            print(f"\n⚠️  Database already contains {existing_count} puzzle(s).")
-            response = input("Do you want to continue and add more puzzles? (y/n): ")
-            if response.lower() != 'y':
-                print("Seeding cancelled.")
-                return
+        print(f"Seeding {', '.join(topics)} from {args.start} to {end_date}...")
         
         try:
-            seed_shopping_puzzle()
-            seed_cars_puzzle()
-            seed_music_puzzle()
-            db.session.commit()
-            print("\n✅ Database seeding completed successfully!")
-            print(f"Total puzzles in database: {Puzzle.query.count()}")
-            
+            counts = seed(
+                topics, args.start, end_date, args.update,
+                args.batch_size or app.config['BULK_INSERT_BATCH_SIZE']
+            )
         except Exception as e:
-            db.session.rollback()
             print(f"\n❌ Error seeding database: {str(e)}")
             raise
+        
+        print(f"\n✅ Inserted {counts['inserted']}, updated {counts['updated']}, skipped {counts['skipped']} puzzle(s).")
+        print(f"Total puzzles in database: {Puzzle.query.count()}")
 
 
 if __name__ == '__main__':
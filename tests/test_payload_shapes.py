@@ -0,0 +1,96 @@
+"""Regression tests for puzzles whose JSON fields have unexpected shapes.
+
+PUT and rows stored before the API validated payloads can hold arrays where
+objects are expected, or string lengths; indexing them must not fail.
+"""
+from datetime import date
+
+import pytest
+
+from app import create_app, db
+from app.models import Puzzle
+
+API_KEY = 'test-key'
+GRID = [['C', 'A', 'T'], [None, 'X', None], ['D', 'O', 'G']]
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    app.config['API_KEY'] = API_KEY
+    
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _puzzle(**values):
+    fields = dict(
+        title='Shapes', topic='shapes', grid_size=3, grid_data=GRID,
+        across_clues={'1': 'Feline'}, down_clues={'2': 'Cross'},
+        clue_positions={'1': {'row': 0, 'col': 0, 'direction': 'across', 'length': 3}},
+        publish_date=date(2024, 1, 1)
+    )
+    fields.update(values)
+    return Puzzle(**fields)
+
+
+def test_search_text_ignores_array_clues():
+    puzzle = _puzzle(across_clues=['Feline'], down_clues=None)
+    
+    assert puzzle.build_search_text() == 'CAT'
+
+
+def test_search_text_ignores_array_positions():
+    puzzle = _puzzle(clue_positions=[{'row': 0, 'col': 0, 'direction': 'across', 'length': 3}])
+    
+    assert puzzle.build_search_text() == 'Feline\nCross'
+
+
+def test_search_text_coerces_string_length():
+    puzzle = _puzzle(clue_positions={
+        '1': {'row': 0, 'col': 0, 'direction': 'across', 'length': '3'},
+        '2': 'not a position',
+        '3': {'row': 2, 'col': 0, 'direction': 'across', 'length': 'three'},
+    })
+    
+    assert puzzle.build_search_text() == 'Feline\nCross\nCAT'
+
+
+def test_refresh_payload_with_malformed_fields(app):
+    puzzle = _puzzle(across_clues=['Feline'], clue_positions={'1': {'length': '7'}})
+    db.session.add(puzzle)
+    db.session.commit()
+    
+    assert puzzle.payload is not None
+    assert puzzle.search_text == 'Cross'
+
+
+def test_update_with_array_fields(app, client):
+    puzzle = _puzzle()
+    db.session.add(puzzle)
+    db.session.commit()
+    
+    response = client.put(
+        f'/api/v1/puzzles/{puzzle.id}',
+        json={
+            'across_clues': ['Feline'],
+            'clue_positions': [{'row': 0, 'col': 0, 'direction': 'across', 'length': '7'}],
+        },
+        headers={'X-API-Key': API_KEY}
+    )
+    
+    assert response.status_code == 200
+    assert response.get_json()['acrossClues'] == ['Feline']
+    
+    response = client.get('/api/v1/puzzles/search?q=cross', headers={'X-API-Key': API_KEY})
+    
+    assert response.status_code == 200
+    assert [result['id'] for result in response.get_json()['results']] == [str(puzzle.id)]